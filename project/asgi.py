@@ -9,8 +9,20 @@ https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
 
-application = get_asgi_application()
+
+class ProjectASGIRequest(ASGIRequest):
+    # 요청마다 async view urlconf 사용 (settings.ROOT_URLCONF는 WSGI와 동일하게 유지)
+    urlconf = 'project.asgi_urls'
+
+
+class ProjectASGIHandler(ASGIHandler):
+    request_class = ProjectASGIRequest
+
+
+django.setup(set_prefix=False)
+application = ProjectASGIHandler()
@@ -0,0 +1,27 @@
+from django.http import Http404
+from django.urls import path, re_path
+
+from users.api.async_views import (
+    AsyncSendCodeView,
+    AsyncVerifyCodeView,
+    AsyncSignupView,
+    AsyncLoginView,
+    AsyncUserDetailView
+)
+from project.urls import urlpatterns as sync_urlpatterns
+
+
+def wsgi_only(request, *args, **kwargs):
+    raise Http404
+
+urlpatterns = [
+    path('auth/send_code/', AsyncSendCodeView.as_view(), name='auth-send-code'),
+    path('auth/verify_code/', AsyncVerifyCodeView.as_view(), name='auth-verify-code'),
+    path('user/signup/', AsyncSignupView.as_view(), name='user-signup'),
+    path('user/login/', AsyncLoginView.as_view(), name='user-user-login'),
+    path('user/detail/', AsyncUserDetailView.as_view(), name='user-user-detail'),
+    # Django 4.1 ASGIHandler는 StreamingHttpResponse를 event loop에서 순회하므로
+    # export의 ORM 조회가 SynchronousOnlyOperation을 발생시킴 -> WSGI에서만 제공
+    re_path(r'^user/export(\.[a-z0-9]+)?/?$', wsgi_only, name='user-export'),
+    *sync_urlpatterns,
+]
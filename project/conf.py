@@ -1,45 +1,199 @@
+import os
 import inspect
 import datetime
+import functools
 from typing import Any
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+def cached_setting(func):
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = func(self)
+            return value
+
+    return property(wrapper)
 
 
 class AppSettings:
-    @property
+    PASSWORD_HASHER_DEFAULT_OPTIONS = {
+        "pbkdf2": {"iterations": 390000},
+        "scrypt": {"work_factor": 2 ** 14, "block_size": 8, "parallelism": 1},
+        "argon2": {"time_cost": 2, "memory_cost": 102400, "parallelism": 8},
+    }
+
+    def __init__(self):
+        self._cache = {}
+
+    def reload(self) -> None:
+        self._cache.clear()
+
+    @cached_setting
     def OTP_TIME_INTERVAL(self) -> int:
         return self._settings("OTP_TIME_INTERVAL", 300)
 
-    @property
+    @cached_setting
+    def OTP_BACKEND(self) -> Any:
+        value = self._settings("OTP_BACKEND", "users.otp_backends.ModelOtpBackend")
+        return self._class(value)
+
+    @cached_setting
+    def OTP_CACHE(self) -> str:
+        return self._settings("OTP_CACHE", "default")
+
+    @cached_setting
+    def OTP_CACHE_TTL(self) -> int:
+        return self._settings("OTP_CACHE_TTL", 60 * 60)
+
+    @cached_setting
+    def AUTH_OTP_RETENTION(self) -> int:
+        return self._settings("AUTH_OTP_RETENTION", 7 * 24 * 60 * 60)
+
+    @cached_setting
+    def AUTH_OTP_PURGE_BATCH_SIZE(self) -> int:
+        return self._settings("AUTH_OTP_PURGE_BATCH_SIZE", 1000)
+
+    @cached_setting
     def AUTH_USER_MODEL(self) -> str:
         value = self._settings("AUTH_USER_MODEL", "users.User")
         return self._model(value)
 
-    @property
+    @cached_setting
     def SIMPLE_JWT_ACCESS_TOKEN_LIFETIME(self) -> datetime:
         default = datetime.timedelta(hours=1)
         return self._multiple_settings("SIMPLE_JWT", "ACCESS_TOKEN_LIFETIME", {}, default)
 
-    @property
+    @cached_setting
     def SIMPLE_JWT_REFRESH_TOKEN_LIFETIME(self) -> datetime:
         default = datetime.timedelta(days=1)
         return self._multiple_settings("SIMPLE_JWT", "REFRESH_TOKEN_LIFETIME", {}, default)
 
-    @property
+    @cached_setting
     def SIMPLE_JWT_UPDATE_LOGIN_SETTING(self) -> bool:
         return self._multiple_settings("SIMPLE_JWT", "UPDATE_LAST_LOGIN", {}, False)
 
-    @property
+    @cached_setting
+    def LAST_LOGIN_DURABILITY(self) -> str:
+        value = self._settings("LAST_LOGIN_DURABILITY", "sync")
+        if value not in ("sync", "buffered"):
+            self._config_error(f"invalid_last_login_durability_{value}")
+        return value
+
+    @cached_setting
+    def LAST_LOGIN_BATCH_SIZE(self) -> int:
+        return self._settings("LAST_LOGIN_BATCH_SIZE", 500)
+
+    @cached_setting
+    def LAST_LOGIN_FLUSH_INTERVAL(self) -> float:
+        return self._settings("LAST_LOGIN_FLUSH_INTERVAL", 1.0)
+
+    @cached_setting
+    def RESPONSE_JSON_BACKEND(self) -> str:
+        value = self._settings("RESPONSE_JSON_BACKEND", "auto")
+        if value not in ("auto", "orjson", "json"):
+            self._config_error(f"invalid_response_json_backend_{value}")
+        return value
+
+    @cached_setting
+    def DATABASE_REPLICAS(self) -> list[str]:
+        return self._settings("DATABASE_REPLICAS", [])
+
+    @cached_setting
+    def METRICS_ENABLED(self) -> bool:
+        return self._settings("METRICS_ENABLED", False)
+
+    @cached_setting
+    def METRICS_ALLOWED_IPS(self) -> list[str]:
+        return self._settings("METRICS_ALLOWED_IPS", ["127.0.0.1", "::1"])
+
+    @cached_setting
+    def USER_SNAPSHOT_TTL(self) -> int:
+        return self._settings("USER_SNAPSHOT_TTL", 30)
+
+    @cached_setting
+    def USER_SNAPSHOT_MAX_SIZE(self) -> int:
+        return self._settings("USER_SNAPSHOT_MAX_SIZE", 10000)
+
+    @cached_setting
+    def USER_SNAPSHOT_CACHE(self) -> str:
+        return self._settings("USER_SNAPSHOT_CACHE", "default")
+
+    @cached_setting
+    def USER_EXPORT_CHUNK_SIZE(self) -> int:
+        return self._settings("USER_EXPORT_CHUNK_SIZE", 2000)
+
+    @cached_setting
+    def PASSWORD_HASHER_OPTIONS(self) -> dict:
+        value = self._settings("PASSWORD_HASHER_OPTIONS", {})
+        return {
+            tier: {**default, **value.get(tier, {})}
+            for tier, default in self.PASSWORD_HASHER_DEFAULT_OPTIONS.items()
+        }
+
+    @cached_setting
+    def PASSWORD_REHASH_IN_BACKGROUND(self) -> bool:
+        return self._settings("PASSWORD_REHASH_IN_BACKGROUND", True)
+
+    @cached_setting
+    def PASSWORD_HASHING_PROCESSES(self) -> int:
+        return self._settings("PASSWORD_HASHING_PROCESSES", 0)
+
+    @cached_setting
+    def PASSWORD_HASHING_QUEUE_SIZE(self) -> int:
+        return self._settings("PASSWORD_HASHING_QUEUE_SIZE", None)
+
+    @cached_setting
+    def SMS_PROVIDER(self) -> Any:
+        value = self._settings("SMS_PROVIDER", "users.notifications.ConsoleSMSProvider")
+        return self._class(value)
+
+    @cached_setting
+    def SMS_MESSAGE_TEMPLATE(self) -> str:
+        return self._settings("SMS_MESSAGE_TEMPLATE", "[project] 인증번호 {otp_code} ({expired_at}까지 유효)")
+
+    @cached_setting
+    def OTP_CODE_IN_RESPONSE(self) -> bool:
+        return self._settings("OTP_CODE_IN_RESPONSE", False)
+
+    @cached_setting
+    def SMS_WORKERS(self) -> int:
+        return self._settings("SMS_WORKERS", 2)
+
+    @cached_setting
+    def SMS_QUEUE_SIZE(self) -> int:
+        return self._settings("SMS_QUEUE_SIZE", 10000)
+
+    @cached_setting
+    def SMS_BATCH_SIZE(self) -> int:
+        return self._settings("SMS_BATCH_SIZE", 100)
+
+    @cached_setting
+    def SMS_MAX_RETRIES(self) -> int:
+        return self._settings("SMS_MAX_RETRIES", 3)
+
+    @cached_setting
+    def SMS_RETRY_BACKOFF(self) -> float:
+        return self._settings("SMS_RETRY_BACKOFF", 0.5)
+
+    @cached_setting
     def REST_FRAMEWORK_AUTHENTICATION_CLASSES(self) -> Any:
         default = "rest_framework_simplejwt.authentication.JWTAuthentication"
         value = self._multiple_settings("REST_FRAMEWORK", "DEFAULT_AUTHENTICATION_CLASSES", {}, default)
         return value
 
-    @property
+    @cached_setting
     def REST_FRAMEWORK_JSON_RESPONSE_RENDERER(self) -> Any:
         default = "rest_framework.renderers.JSONRenderer"
         value = self._multiple_settings("REST_FRAMEWORK", "DEFAULT_RENDERER_CLASSES", {}, default)
         return value
 
-    @property
+    @cached_setting
     def REST_FRAMEWORK_THROTTLE_CLASSES(self) -> Any:
         default = (
             'rest_framework.throttling.AnonRateThrottle',
@@ -48,7 +202,16 @@ class AppSettings:
         value = self._multiple_settings("REST_FRAMEWORK", "DEFAULT_THROTTLE_CLASSES", {}, default)
         return value
 
-    @property
+    @cached_setting
+    def REST_FRAMEWORK_SCOPED_THROTTLE_CLASS(self) -> Any:
+        value = self._settings("SCOPED_THROTTLE_CLASS", "rest_framework.throttling.ScopedRateThrottle")
+        return self._class(value)
+
+    @cached_setting
+    def THROTTLE_CACHE(self) -> str:
+        return self._settings("THROTTLE_CACHE", "default")
+
+    @cached_setting
     def REST_FRAMEWORK_DEFAULT_THROTTLE_RATES(self) -> Any:
         default = (
             'rest_framework.throttling.AnonRateThrottle',
@@ -60,13 +223,13 @@ class AppSettings:
     def _multiple_settings(self, name: str, detail: str, name_default: Any = None, detail_default: Any = None) -> Any:
         settings = self._settings(name, name_default)
         value = settings.get(detail, detail_default)
-        print(value)
         if isinstance(value, str):
             return self._class(value)
         elif isinstance(value, list) or isinstance(value, tuple):
             return [self._class(v) for v in value]
         elif isinstance(value, dict):
             return {k: self._class(v) for k, v in value.items()}
+        return value
 
     def _settings(self, name: str, default: Any = None) -> Any:
         from django.conf import settings
@@ -106,4 +269,80 @@ class AppSettings:
             self._config_error(f"import_error_{path}")
 
 
+class DatabaseSettings:
+    """
+    DATABASES from the environment: persistent connections, health checks,
+    PgBouncer connection pooling and read replicas.
+    """
+    POOL_MODES = ("none", "pgbouncer")
+
+    def __init__(self, environ: dict = None):
+        self.environ = os.environ if environ is None else environ
+
+    def databases(self) -> dict:
+        databases = {"default": self.database(self.get("POSTGRES_HOST", "db"), self.get("POSTGRES_PORT", "5432"))}
+        for alias, (host, port) in zip(self.replica_aliases(), self.replica_hosts()):
+            databases[alias] = {**self.database(host, port), "TEST": {"MIRROR": "default"}}
+        return databases
+
+    def database(self, host: str, port: str) -> dict:
+        database = {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": self.get("POSTGRES_NAME", "postgres"),
+            "USER": self.get("POSTGRES_USER", "postgres"),
+            "PASSWORD": self.get("POSTGRES_PASSWORD", "postgres"),
+            "HOST": host,
+            "PORT": port,
+            # 요청마다 연결을 새로 맺지 않고 CONN_MAX_AGE(second) 동안 재사용, 재사용 전 연결 상태 확인
+            "CONN_MAX_AGE": self.get_int("POSTGRES_CONN_MAX_AGE", 60),
+            "CONN_HEALTH_CHECKS": self.get_bool("POSTGRES_CONN_HEALTH_CHECKS", True),
+            "OPTIONS": {"connect_timeout": self.get_int("POSTGRES_CONNECT_TIMEOUT", 5)},
+        }
+
+        if self.pool_mode() == "pgbouncer":
+            # transaction pooling: 서버 측 cursor는 transaction 밖에서 유지되지 않음
+            database["DISABLE_SERVER_SIDE_CURSORS"] = True
+        return database
+
+    def pool_mode(self) -> str:
+        value = self.get("POSTGRES_POOL", "none").lower()
+        if value not in self.POOL_MODES:
+            self._config_error(f"invalid_postgres_pool_{value}")
+        return value
+
+    def replica_hosts(self) -> list[tuple[str, str]]:
+        # POSTGRES_REPLICA_HOSTS="replica1:5432,replica2"
+        hosts = []
+        for value in filter(None, map(str.strip, self.get("POSTGRES_REPLICA_HOSTS", "").split(","))):
+            host, _, port = value.partition(":")
+            hosts.append((host, port or self.get("POSTGRES_PORT", "5432")))
+        return hosts
+
+    def replica_aliases(self) -> list[str]:
+        return [f"replica_{i}" for i in range(len(self.replica_hosts()))]
+
+    def get(self, name: str, default: str) -> str:
+        return self.environ.get(name, default)
+
+    def get_int(self, name: str, default: int) -> int:
+        value = self.get(name, None)
+        try:
+            return default if value is None else int(value)
+        except ValueError:
+            self._config_error(f"invalid_{name.lower()}_{value}")
+
+    def get_bool(self, name: str, default: bool) -> bool:
+        value = self.get(name, None)
+        return default if value is None else value.lower() == "true"
+
+    def _config_error(self, message: str) -> None:
+        from django.core.exceptions import ImproperlyConfigured
+        raise ImproperlyConfigured(message)
+
+
 app_settings = AppSettings()
+
+
+@receiver(setting_changed)
+def reload_app_settings(**kwargs):
+    app_settings.reload()
@@ -10,10 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 import datetime
+import importlib.util
 import os
 import string
 import random
 from pathlib import Path
+from django.core.exceptions import ImproperlyConfigured
+from project.conf import DatabaseSettings
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -53,6 +56,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'utils.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -87,17 +91,37 @@ WSGI_APPLICATION = 'project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
 
-DATABASES = {
+# POSTGRES_* 환경변수 (project.conf.DatabaseSettings)
+#   POSTGRES_CONN_MAX_AGE / POSTGRES_CONN_HEALTH_CHECKS: 연결 재사용 시간(second) / 재사용 전 상태 확인
+#   POSTGRES_POOL: none / pgbouncer (HOST를 PgBouncer로 지정, Django 4.1에는 내장 pool이 없음)
+#   POSTGRES_REPLICA_HOSTS: 읽기 전용 replica ("host:port,host"), utils.routers.read_replica() 안의 조회만 사용
+database_settings = DatabaseSettings()
+DATABASES = database_settings.databases()
+DATABASE_REPLICAS = database_settings.replica_aliases()
+DATABASE_ROUTERS = ['utils.routers.ReplicaRouter']
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+
+THROTTLE_REDIS_URL = os.environ.get('THROTTLE_REDIS_URL')
+
+CACHES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.environ.get('POSTGRES_NAME', 'postgres'),
-        "USER": os.environ.get('POSTGRES_USER', 'postgres'),
-        "PASSWORD": os.environ.get('POSTGRES_PASSWORD', 'postgres'),
-        "HOST": "db",
-        "PORT": os.environ.get('POSTGRES_PORT', 5432),
-    }
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # shared by every worker when THROTTLE_REDIS_URL is set, in-process otherwise (local / tests)
+    "throttle": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": THROTTLE_REDIS_URL,
+    } if THROTTLE_REDIS_URL else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "throttle",
+    },
 }
 
+THROTTLE_CACHE = "throttle"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -118,6 +142,51 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing: the hasher of PASSWORD_HASHER_TIER is used for new hashes,
+# the others only verify (and upgrade on login) existing hashes.
+PASSWORD_HASHER_TIER = os.environ.get('PASSWORD_HASHER_TIER', 'pbkdf2')
+
+PASSWORD_HASHER_CLASSES = {
+    'pbkdf2': 'users.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'users.hashers.ScryptPasswordHasher',
+}
+# argon2 tier는 argon2-cffi가 설치된 경우에만 등록 (없으면 argon2 hash 생성 / 확인이 실행 중에 실패)
+if importlib.util.find_spec('argon2') is not None:
+    PASSWORD_HASHER_CLASSES['argon2'] = 'users.hashers.Argon2PasswordHasher'
+elif PASSWORD_HASHER_TIER == 'argon2':
+    raise ImproperlyConfigured("password_hasher_tier_argon2_requires_argon2_cffi")
+if PASSWORD_HASHER_TIER not in PASSWORD_HASHER_CLASSES:
+    raise ImproperlyConfigured(f"invalid_password_hasher_tier_{PASSWORD_HASHER_TIER}")
+
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHER_TIER],
+    *[path for tier, path in PASSWORD_HASHER_CLASSES.items() if tier != PASSWORD_HASHER_TIER],
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# work factors, calibrate with `python manage.py benchmark_hashers --target-ms <ms>`
+PASSWORD_HASHER_OPTIONS = {
+    'pbkdf2': {
+        'iterations': int(os.environ.get('PBKDF2_ITERATIONS', 390000)),
+    },
+    'scrypt': {
+        'work_factor': int(os.environ.get('SCRYPT_WORK_FACTOR', 2 ** 14)),
+    },
+    'argon2': {
+        'time_cost': int(os.environ.get('ARGON2_TIME_COST', 2)),
+        'memory_cost': int(os.environ.get('ARGON2_MEMORY_COST', 102400)),
+    },
+}
+
+# rehash-on-login upgrades run in a background thread instead of the request thread
+PASSWORD_REHASH_IN_BACKGROUND = os.environ.get('PASSWORD_REHASH_IN_BACKGROUND', 'true').lower() == 'true'
+
+# hash / verify passwords in a process pool so a login does not hold the worker's GIL (0: in the request thread)
+# at most PASSWORD_HASHING_QUEUE_SIZE (default: PASSWORD_HASHING_PROCESSES) hashes are handed to the pool at once
+PASSWORD_HASHING_PROCESSES = int(os.environ.get('PASSWORD_HASHING_PROCESSES', 0))
+PASSWORD_HASHING_QUEUE_SIZE = int(os.environ.get('PASSWORD_HASHING_QUEUE_SIZE', 0)) or None
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.1/topics/i18n/
 
@@ -144,10 +213,64 @@ AUTH_USER_MODEL = 'users.User'
 
 OTP_TIME_INTERVAL = 300
 
+# where issued OTPs live
+# users.otp_backends.ModelOtpBackend: AuthOtp table
+# users.otp_backends.CacheOtpBackend: OTP_CACHE, expires OTP_CACHE_TTL(second) after issue (no database writes),
+#                                     OTP_CACHE must be shared by every worker (THROTTLE_REDIS_URL)
+OTP_BACKEND = os.environ.get('OTP_BACKEND', 'users.otp_backends.ModelOtpBackend')
+OTP_CACHE = os.environ.get('OTP_CACHE', THROTTLE_CACHE)
+OTP_CACHE_TTL = int(os.environ.get('OTP_CACHE_TTL', 60 * 60))
+
+# purge_auth_otps: AuthOtp rows older than OTP_TIME_INTERVAL + AUTH_OTP_RETENTION(second) are deleted
+# AUTH_OTP_PURGE_BATCH_SIZE rows per transaction
+AUTH_OTP_RETENTION = int(os.environ.get('AUTH_OTP_RETENTION', 7 * 24 * 60 * 60))
+AUTH_OTP_PURGE_BATCH_SIZE = int(os.environ.get('AUTH_OTP_PURGE_BATCH_SIZE', 1000))
+
+# CachedJWTAuthentication: lifetime(second) / max entries of per-process user snapshots (0 disables the cache)
+# every snapshot hit checks a per-user version in USER_SNAPSHOT_CACHE, bumped on each change in any worker,
+# so USER_SNAPSHOT_CACHE must be shared by every worker (THROTTLE_REDIS_URL); otherwise a change made
+# in another worker is seen after at most USER_SNAPSHOT_TTL seconds
+USER_SNAPSHOT_TTL = int(os.environ.get('USER_SNAPSHOT_TTL', 30))
+USER_SNAPSHOT_MAX_SIZE = int(os.environ.get('USER_SNAPSHOT_MAX_SIZE', 10000))
+USER_SNAPSHOT_CACHE = os.environ.get('USER_SNAPSHOT_CACHE', THROTTLE_CACHE)
+
+# export_users / user/export/: rows fetched per keyset page (WHERE pk > last ORDER BY pk LIMIT n)
+USER_EXPORT_CHUNK_SIZE = int(os.environ.get('USER_EXPORT_CHUNK_SIZE', 2000))
+
+# ResponseRenderer json backend: auto (orjson if installed) / orjson / json
+RESPONSE_JSON_BACKEND = os.environ.get('RESPONSE_JSON_BACKEND', 'auto')
+
+# per-action query count / SQL / serializer / render / throttle histograms, exported at /metrics (per process)
+# only served to METRICS_ALLOWED_IPS (comma separated, e.g. the Prometheus scraper)
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'false').lower() == 'true'
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.environ.get('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',') if ip.strip()]
+
+# sliding window counters: utils.throttling.{Anon,User,Scoped}RateThrottle
+# token bucket (GCRA):      utils.throttling.{Anon,User,Scoped}GCRAThrottle
+SCOPED_THROTTLE_CLASS = 'utils.throttling.ScopedRateThrottle'
+
+# "sync": last login is written on the request path
+# "buffered": last login is flushed in bulk by a background thread (LAST_LOGIN_BATCH_SIZE / LAST_LOGIN_FLUSH_INTERVAL)
+LAST_LOGIN_DURABILITY = os.environ.get('LAST_LOGIN_DURABILITY', 'sync')
+LAST_LOGIN_BATCH_SIZE = int(os.environ.get('LAST_LOGIN_BATCH_SIZE', 500))
+LAST_LOGIN_FLUSH_INTERVAL = float(os.environ.get('LAST_LOGIN_FLUSH_INTERVAL', 1.0))
+
+# OTP delivery: SMS_WORKERS background threads send up to SMS_BATCH_SIZE messages per provider call
+# and retry a failed batch SMS_MAX_RETRIES times (SMS_RETRY_BACKOFF * 2 ** attempt seconds apart)
+# SMS_WORKERS = 0 sends on the request thread
+SMS_PROVIDER = os.environ.get('SMS_PROVIDER', 'users.notifications.ConsoleSMSProvider')
+SMS_WORKERS = int(os.environ.get('SMS_WORKERS', 2))
+SMS_QUEUE_SIZE = int(os.environ.get('SMS_QUEUE_SIZE', 10000))
+SMS_BATCH_SIZE = int(os.environ.get('SMS_BATCH_SIZE', 100))
+SMS_MAX_RETRIES = int(os.environ.get('SMS_MAX_RETRIES', 3))
+SMS_RETRY_BACKOFF = float(os.environ.get('SMS_RETRY_BACKOFF', 0.5))
+# send_code 응답에 인증번호 포함 (local / load test 전용, 운영에서는 SMS로만 전달)
+OTP_CODE_IN_RESPONSE = os.environ.get('OTP_CODE_IN_RESPONSE', 'false').lower() == 'true'
+
 REST_FRAMEWORK = {
     'DEFAULT_THROTTLE_CLASSES': (
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'utils.throttling.AnonRateThrottle',
+        'utils.throttling.UserRateThrottle'
     ),
     'DEFAULT_THROTTLE_RATES': {
         'default': None,
@@ -163,10 +286,14 @@ REST_FRAMEWORK = {
     ],
     'EXCEPTION_HANDLER': 'utils.exceptions.custom_exception_handler',
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.api.authentication.CachedJWTAuthentication',
     ]
 }
 
+# load test (tests/bench/loadtest.py): 모든 throttle rate 해제
+if os.environ.get('DISABLE_THROTTLING', 'false').lower() == 'true':
+    REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = dict.fromkeys(REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'])
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": datetime.timedelta(hours=1),
     "REFRESH_TOKEN_LIFETIME": datetime.timedelta(days=1),
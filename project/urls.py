@@ -18,6 +18,7 @@ from django.urls import path, include
 
 from rest_framework.routers import DefaultRouter
 from users.api.views import AuthViewSet, UserViewSet, PassWordViewSet
+from utils.metrics import metrics_view
 
 router = DefaultRouter()
 router.register("auth", AuthViewSet, basename="auth")
@@ -26,5 +27,6 @@ router.register("passwd", PassWordViewSet, basename="passwd")
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('', include(router.urls)),
 ]
@@ -0,0 +1,12 @@
+import os
+import sys
+import unittest
+
+# 실행 시간을 측정하는 benchmark는 RUN_BENCHMARKS=true 일 때만 실행 (기본 test / CI에서는 skip)
+RUN_BENCHMARKS = os.environ.get("RUN_BENCHMARKS", "false").lower() == "true"
+benchmark = unittest.skipUnless(RUN_BENCHMARKS, "set RUN_BENCHMARKS=true to run benchmarks")
+
+
+def report(message: str) -> None:
+    if RUN_BENCHMARKS:
+        sys.stderr.write(f"\n{message}\n")
@@ -0,0 +1,218 @@
+"""
+Signup funnel load test: send_code -> verify_code -> signup -> login -> detail.
+
+    DISABLE_THROTTLING=true OTP_CODE_IN_RESPONSE=true METRICS_ENABLED=true python manage.py runserver --noreload
+    python -m tests.bench.loadtest --base-url http://127.0.0.1:8000 --users 2000 --concurrency 32 \
+        --output bench.json --baseline previous.json
+"""
+import argparse
+import datetime
+import http.client
+import json
+import math
+import re
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+STEPS = [
+    ("send_code", "POST", "/auth/send_code/", "auth-send-code"),
+    ("verify_code", "POST", "/auth/verify_code/", "auth-verify-code"),
+    ("signup", "POST", "/user/signup/", "user-signup"),
+    ("login", "POST", "/user/login/", "user-user-login"),
+    ("detail", "GET", "/user/detail/", "user-user-detail"),
+]
+METRIC_LINE = re.compile(r'^db_queries_per_request_(sum|count)\{action="([^"]+)"\} (\S+)$')
+
+
+class Client:
+    def __init__(self, base_url: str):
+        url = urlparse(base_url)
+        self.connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=30)
+
+    def request(self, method: str, path: str, data: dict = None, token: str = None) -> tuple[int, dict, str]:
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        body = json.dumps(data) if data is not None else None
+        try:
+            self.connection.request(method, path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            content = response.read()
+        except (http.client.HTTPException, OSError):
+            self.connection.close()
+            raise
+        try:
+            return response.status, json.loads(content), content.decode()
+        except ValueError:
+            return response.status, {}, content.decode()
+
+
+def phone_number(index: int) -> str:
+    return f"070-{index // 10000 % 10000:04d}-{index % 10000:04d}"
+
+
+def run_funnel(client: Client, run_id: str, index: int, results: dict, lock: threading.Lock) -> None:
+    number, password = phone_number(index), "bench-password"
+    email = f"bench-{run_id}-{index}@example.com"
+    context = {}
+    payloads = {
+        "send_code": lambda: {"number": number},
+        "verify_code": lambda: {"number": number, "otp_code": context["otp_code"]},
+        "signup": lambda: {
+            "phone_number": number,
+            "otp_register_code": context["otp_code"],
+            "email": email,
+            "username": f"bench{index}",
+            "nickname": f"bench{index}",
+            "password": password
+        },
+        "login": lambda: {"email": email, "password": password},
+        "detail": lambda: None,
+    }
+    for step, method, path, _ in STEPS:
+        started_at = time.perf_counter()
+        try:
+            status, body, _ = client.request(method, path, payloads[step](), context.get("access"))
+        except (http.client.HTTPException, OSError):
+            status, body = 0, {}
+        elapsed = time.perf_counter() - started_at
+
+        with lock:
+            results[step]["latencies"].append(elapsed)
+            if not 200 <= status < 300:
+                results[step]["errors"] += 1
+        if not 200 <= status < 300:
+            return
+        data = body.get("data", {})
+        if step == "send_code":
+            context["otp_code"] = data["otp_code"]
+        elif step == "login":
+            context["access"] = data["access"]
+
+
+def scrape_queries(base_url: str) -> dict[str, list[float]]:
+    status, _, text = Client(base_url).request("GET", "/metrics")
+    values = {}
+    if status != 200:
+        return values
+    for line in text.splitlines():
+        match = METRIC_LINE.match(line)
+        if match:
+            kind, action, value = match.groups()
+            values.setdefault(action, [0.0, 0.0])[kind == "count"] = float(value)
+    return values
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    # nearest-rank
+    values = sorted(values)
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+def summarize(step_results: dict, elapsed: float) -> dict:
+    latencies = step_results["latencies"]
+    return {
+        "count": len(latencies),
+        "errors": step_results["errors"],
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run_loadtest(base_url: str, users: int, concurrency: int, offset: int = 0) -> dict:
+    run_id = uuid.uuid4().hex[:8]
+    results = {step: {"latencies": [], "errors": 0} for step, *_ in STEPS}
+    lock, local = threading.Lock(), threading.local()
+
+    def worker(index: int) -> None:
+        if not hasattr(local, "client"):
+            local.client = Client(base_url)
+        run_funnel(local.client, run_id, index, results, lock)
+
+    before = scrape_queries(base_url)
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(worker, range(offset, offset + users)))
+    elapsed = time.perf_counter() - started_at
+    after = scrape_queries(base_url)
+
+    queries = {}
+    for step, _, _, action in STEPS:
+        total, count = after.get(action, [0.0, 0.0])
+        previous_total, previous_count = before.get(action, [0.0, 0.0])
+        if count > previous_count:
+            queries[step] = round((total - previous_total) / (count - previous_count), 2)
+
+    requests = sum(len(result["latencies"]) for result in results.values())
+    return {
+        "meta": {
+            "run_id": run_id,
+            "revision": git_revision(),
+            "started_at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            "base_url": base_url,
+            "users": users,
+            "concurrency": concurrency,
+            "elapsed_s": round(elapsed, 3),
+        },
+        "total": {
+            "requests": requests,
+            "errors": sum(result["errors"] for result in results.values()),
+            "rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        },
+        "steps": {step: summarize(result, elapsed) for step, result in results.items()},
+        "queries_per_request": queries,
+    }
+
+
+def compare(report: dict, baseline: dict) -> list[str]:
+    lines = []
+    for step, current in report["steps"].items():
+        previous = baseline.get("steps", {}).get(step)
+        if not previous:
+            continue
+        deltas = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "rps"):
+            if previous[key]:
+                deltas.append(f"{key} {(current[key] - previous[key]) / previous[key] * 100:+.1f}%")
+        lines.append(f"{step}: " + ", ".join(deltas))
+    return lines
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--offset", type=int, default=0, help="first phone number index")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    args = parser.parse_args(argv)
+
+    report = run_loadtest(args.base_url, args.users, args.concurrency, args.offset)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            print("\n".join(compare(report, json.load(f))))
+    return report
+
+
+if __name__ == "__main__":
+    main()
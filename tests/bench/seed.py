@@ -0,0 +1,37 @@
+"""
+Seed the database with benchmark volumes of users and AuthOtp rows.
+
+    python -m tests.bench.seed --users 1000000 --otps 10000000
+"""
+import argparse
+import os
+import time
+
+
+def seed(factory, total: int, chunk_size: int) -> None:
+    started_at, created = time.perf_counter(), 0
+    for count in factory.create_bulk(total, chunk_size=chunk_size):
+        created += count
+        elapsed = time.perf_counter() - started_at
+        print(f"{factory._meta.model.__name__}: {created}/{total} ({created / elapsed:.0f} rows/s)", flush=True)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--otps", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project.settings")
+    import django
+    django.setup()
+
+    from tests.factories import AuthOtpFactory, UserFactory
+
+    seed(UserFactory, args.users, args.chunk_size)
+    seed(AuthOtpFactory, args.otps, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import timeit
+from django.test import SimpleTestCase, override_settings
+from project.conf import app_settings
+from tests.bench import benchmark, report
+
+REQUEST_SETTINGS = ["REST_FRAMEWORK_THROTTLE_CLASSES", "SIMPLE_JWT_UPDATE_LOGIN_SETTING"]
+
+
+def _read_request_settings():
+    for name in REQUEST_SETTINGS:
+        getattr(app_settings, name)
+
+
+def _read_request_settings_uncached():
+    app_settings.reload()
+    _read_request_settings()
+
+
+class AppSettingsBenchmark(SimpleTestCase):
+    number = 2000
+
+    def _per_request(self, func) -> float:
+        return min(timeit.repeat(func, number=self.number, repeat=3)) / self.number
+
+    @benchmark
+    def test_per_request_overhead(self):
+        before = self._per_request(_read_request_settings_uncached)
+        after = self._per_request(_read_request_settings)
+        report(f"app_settings per request: before={before * 1e6:.2f}us after={after * 1e6:.2f}us")
+
+        # 성공: 캐시된 설정값 조회가 매번 설정을 해석하는 것보다 빠름
+        assert after < before
+
+    def test_setting_changed_invalidation(self):
+        assert app_settings.OTP_TIME_INTERVAL == 300
+
+        # 성공: 테스트에서 설정을 변경하면 캐시가 초기화됨
+        with override_settings(OTP_TIME_INTERVAL=10):
+            assert app_settings.OTP_TIME_INTERVAL == 10
+        assert app_settings.OTP_TIME_INTERVAL == 300
@@ -0,0 +1,68 @@
+import statistics
+import time
+import unittest
+
+from django.core.cache import caches
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+
+from project.conf import app_settings
+from tests.bench import benchmark, report
+from tests.factories import sequence_phone_number
+
+
+@benchmark
+@unittest.skipUnless(connection.vendor == "postgresql", "connection setup cost is only measurable on PostgreSQL")
+@override_settings(SMS_WORKERS=0, METRICS_ENABLED=False, OTP_CODE_IN_RESPONSE=True)
+class ConnectionReuseBenchmark(TransactionTestCase):
+    users = 30
+    url_prefix = "http://127.0.0.1:8000/"
+
+    def request(self, client: APIClient, reconnect: bool, method: str, path: str, data: dict = None):
+        caches[app_settings.THROTTLE_CACHE].clear()
+        if reconnect:
+            # CONN_MAX_AGE=0: 요청마다 새 연결
+            connection.close()
+        started_at = time.perf_counter()
+        response = getattr(client, method)(self.url_prefix + path, data, format="json")
+        return response, time.perf_counter() - started_at
+
+    def run_funnel(self, reconnect: bool, offset: int) -> dict[str, list[float]]:
+        timings = {"send_code": [], "verify_code": [], "signup": [], "login": [], "detail": []}
+        for index in range(offset, offset + self.users):
+            client, number, email = APIClient(), sequence_phone_number(index, "070"), f"bench{index}@example.com"
+            response, elapsed = self.request(client, reconnect, "post", "auth/send_code/", {"number": number})
+            timings["send_code"].append(elapsed)
+            code = response.data["otp_code"]
+
+            _, elapsed = self.request(client, reconnect, "post", "auth/verify_code/", {"number": number, "otp_code": code})
+            timings["verify_code"].append(elapsed)
+            _, elapsed = self.request(client, reconnect, "post", "user/signup/", {
+                "phone_number": number,
+                "otp_register_code": code,
+                "email": email,
+                "username": f"bench{index}",
+                "nickname": f"bench{index}",
+                "password": "password"
+            })
+            timings["signup"].append(elapsed)
+            response, elapsed = self.request(client, reconnect, "post", "user/login/", {"email": email, "password": "password"})
+            timings["login"].append(elapsed)
+
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+            _, elapsed = self.request(client, reconnect, "get", "user/detail/")
+            timings["detail"].append(elapsed)
+        return timings
+
+    def test_latency_per_endpoint(self):
+        reconnect = self.run_funnel(reconnect=True, offset=0)
+        persistent = self.run_funnel(reconnect=False, offset=self.users)
+
+        for endpoint in reconnect:
+            before, after = statistics.median(reconnect[endpoint]), statistics.median(persistent[endpoint])
+            report(f"{endpoint}: reconnect={before * 1000:.2f}ms persistent={after * 1000:.2f}ms "
+                  f"({(after - before) / before * 100:+.1f}%)")
+
+        # 성공: 연결을 재사용하면 요청당 연결 비용만큼 빨라짐
+        assert statistics.median(persistent["detail"]) < statistics.median(reconnect["detail"])
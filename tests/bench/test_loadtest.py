@@ -0,0 +1,39 @@
+from django.core.cache import caches
+from django.test import LiveServerTestCase, override_settings
+
+from project.conf import app_settings
+from utils.metrics import registry
+from tests.bench.loadtest import STEPS, compare, percentile, run_loadtest
+
+
+@override_settings(METRICS_ENABLED=True, SMS_WORKERS=0, OTP_CODE_IN_RESPONSE=True)
+class LoadTestSmokeTestCase(LiveServerTestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        registry.reset()
+
+    def test_percentile(self):
+        values = [i / 100 for i in range(1, 101)]
+        assert percentile(values, 50) == 0.5
+        assert percentile(values, 95) == 0.95
+        assert percentile(values, 99) == 0.99
+        assert percentile([], 99) == 0.0
+
+    def test_signup_funnel(self):
+        # live server가 sqlite in-memory 연결을 공유하므로 순차 실행 (동시성은 PostgreSQL 대상으로 측정)
+        report = run_loadtest(self.live_server_url, users=3, concurrency=1)
+
+        # 성공: 모든 단계가 오류 없이 완료되고 p50/p95/p99, RPS, 요청당 query 수를 기록
+        assert report["total"]["requests"] == 3 * len(STEPS)
+        assert report["total"]["errors"] == 0
+        for step, *_ in STEPS:
+            result = report["steps"][step]
+            assert result["count"] == 3
+            assert 0 < result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+            assert result["rps"] > 0
+            assert report["queries_per_request"][step] > 0
+
+        # 성공: 이전 결과와 비교
+        lines = compare(report, report)
+        assert len(lines) == len(STEPS)
+        assert "p95_ms +0.0%" in lines[0]
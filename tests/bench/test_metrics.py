@@ -0,0 +1,33 @@
+import timeit
+from django.test import SimpleTestCase
+
+from utils.metrics import RequestMetrics, current_metrics, record_query
+from tests.bench import benchmark, report
+
+
+def _execute(sql, params, many, context):
+    return None
+
+
+@benchmark
+class MetricsOverheadBenchmark(SimpleTestCase):
+    number = 100000
+
+    def _measure(self, func):
+        return min(timeit.repeat(func, number=self.number, repeat=3)) / self.number
+
+    def test_query_recorder_cost(self):
+        baseline = self._measure(lambda: _execute("SELECT 1", None, False, {}))
+        idle = self._measure(lambda: record_query(_execute, "SELECT 1", None, False, {}))
+        token = current_metrics.set(RequestMetrics())
+        try:
+            recording = self._measure(lambda: record_query(_execute, "SELECT 1", None, False, {}))
+        finally:
+            current_metrics.reset(token)
+        report(
+            f"query recorder: baseline={baseline * 1e6:.3f}us "
+            f"idle={idle * 1e6:.3f}us recording={recording * 1e6:.3f}us"
+        )
+
+        # 성공: query 하나당 추가 비용이 수 microsecond 이하
+        assert recording - baseline < 5e-6
@@ -0,0 +1,57 @@
+import json
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+
+from utils.renderers import ResponseRenderer, set_response_key
+from tests.bench import benchmark, report
+
+USER = {
+    "id": 1,
+    "email": "email@gmail.com",
+    "username": "username",
+    "nickname": "nickname",
+    "phone_number": "010-0000-0000",
+    "is_staff": False,
+    "last_login_type": "email",
+    "last_login_datetime": timezone.now().isoformat(),
+}
+PAYLOADS = {
+    "user_detail": {"user": USER},
+    "user_login": {"user": USER, "access": "a" * 230, "refresh": "r" * 230},
+}
+
+
+def _render_stdlib_str(data, renderer_context):
+    # 이전 구현: str을 반환하고 Django가 bytes로 다시 인코딩
+    status, data_key = set_response_key(renderer_context["response"].status_code)
+    return json.dumps({"status": status, data_key: data}).encode("utf-8")
+
+
+@benchmark
+class ResponseRendererBenchmark(SimpleTestCase):
+    number = 5000
+
+    def _measure(self, render, data):
+        context = {"response": SimpleNamespace(status_code=200)}
+        elapsed = min(timeit.repeat(lambda: render(data, renderer_context=context), number=self.number, repeat=3))
+        tracemalloc.start()
+        render(data, renderer_context=context)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed / self.number, peak
+
+    def test_render_cost(self):
+        for name, data in PAYLOADS.items():
+            before = self._measure(_render_stdlib_str, data)
+            with override_settings(RESPONSE_JSON_BACKEND="orjson"):
+                after = self._measure(ResponseRenderer().render, data)
+            report(
+                f"{name}: before={before[0] * 1e6:.2f}us/{before[1]}B "
+                f"after={after[0] * 1e6:.2f}us/{after[1]}B"
+            )
+
+            # 성공: orjson backend의 직렬화 시간이 기존 구현보다 짧음
+            assert after[0] < before[0]
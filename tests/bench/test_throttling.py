@@ -0,0 +1,43 @@
+import timeit
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from rest_framework import throttling
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from project.conf import app_settings
+from utils.throttling import AnonRateThrottle, AnonGCRAThrottle
+from tests.bench import benchmark, report
+
+RATES = ["10/day", "1000/day", "5000/day"]
+
+
+@benchmark
+class ThrottlingBenchmark(APITestCase):
+    number = 200
+
+    def setUp(self) -> None:
+        self.request = APIRequestFactory().post("/auth/send_code/")
+        self.request.user = AnonymousUser()
+
+    def _per_request(self, throttle_class, rate) -> float:
+        caches["default"].clear()
+        caches[app_settings.THROTTLE_CACHE].clear()
+        throttle = type(throttle_class.__name__, (throttle_class,), {"rate": rate})()
+        throttle.timer = lambda: 1_000_000.0
+        num, _ = throttle.parse_rate(rate)
+        for i in range(max(0, num - self.number)):
+            throttle.allow_request(self.request, None)
+        return timeit.timeit(lambda: throttle.allow_request(self.request, None), number=self.number) / self.number
+
+    def test_per_request_cost(self):
+        results = {}
+        for throttle_class in (throttling.AnonRateThrottle, AnonRateThrottle, AnonGCRAThrottle):
+            results[throttle_class] = [self._per_request(throttle_class, rate) for rate in RATES]
+            costs = " ".join(f"{rate}={cost * 1e6:.1f}us" for rate, cost in zip(RATES, results[throttle_class]))
+            report(f"{throttle_class.__module__}.{throttle_class.__name__}: {costs}")
+
+        # 성공: 상태 크기가 일정한 throttle은 허용 요청 수와 무관하게 요청당 비용이 일정
+        for throttle_class in (AnonRateThrottle, AnonGCRAThrottle):
+            smallest, largest = results[throttle_class][0], results[throttle_class][-1]
+            assert largest < smallest * 3 + 20e-6
+            assert largest < results[throttling.AnonRateThrottle][-1]
@@ -1,8 +1,15 @@
+import functools
 import random
+import re
+from typing import Iterator
+
 import pyotp
 import factory
+from django.contrib.auth.hashers import make_password
+from django.test import override_settings
 from factory import fuzzy
 from users.models import User, AuthOtp
+from users.notifications import LocMemSMSProvider, sms_dispatcher
 from users.choices import AuthOtpTypeEnum
 
 otp_register_code = fuzzy.FuzzyInteger(low=100000, high=999999)
@@ -16,7 +23,57 @@ def generate_phone_number_string():
     return "-".join(["010", _rand_str(), _rand_str()])
 
 
-class UserFactory(factory.django.DjangoModelFactory):
+# 인증번호는 응답에 포함되지 않으므로 tests에서는 발송된 SMS에서 확인
+sms_outbox = override_settings(SMS_PROVIDER="users.notifications.LocMemSMSProvider", SMS_WORKERS=0)
+
+
+def sent_otp_code(number: str) -> str:
+    sms_dispatcher.join()
+    message = next(message for message in reversed(LocMemSMSProvider.outbox) if message.number == number)
+    return re.search(r"\b\d{6}\b", message.body).group()
+
+
+def sequence_phone_number(index: int, prefix: str = "010") -> str:
+    # index 0 ~ 99,999,999 까지 중복 없는 번호
+    return f"{prefix}-{index // 10000 % 10000:04d}-{index % 10000:04d}"
+
+
+BULK_PASSWORD = "bulk-password"
+
+
+@functools.lru_cache
+def bulk_password_hash(password: str = BULK_PASSWORD) -> str:
+    return make_password(password)
+
+
+class BulkFactoryMixin:
+    """
+    bulk mode: instance를 메모리에서 만들고 chunk 단위로 bulk_create (get_or_create / signal 생략)
+    """
+
+    @classmethod
+    def bulk_attributes(cls, index: int) -> dict:
+        return {}
+
+    @classmethod
+    def create_bulk(cls, size: int, start: int = 0, chunk_size: int = 10000, **kwargs) -> Iterator[int]:
+        manager = cls._meta.model._default_manager
+        for offset in range(start, start + size, chunk_size):
+            objs = [
+                cls.build(**{**cls.bulk_attributes(index), **kwargs})
+                for index in range(offset, min(offset + chunk_size, start + size))
+            ]
+            manager.bulk_create(objs, batch_size=chunk_size)
+            yield len(objs)
+
+    @classmethod
+    def create_bulk_batch(cls, size: int, **kwargs) -> list:
+        return cls._meta.model._default_manager.bulk_create(
+            [cls.build(**{**cls.bulk_attributes(index), **kwargs}) for index in range(size)]
+        )
+
+
+class UserFactory(BulkFactoryMixin, factory.django.DjangoModelFactory):
     class Meta:
         model = User
         django_get_or_create = ["username", "nickname", "phone_number", "password"]
@@ -27,8 +84,19 @@ class UserFactory(factory.django.DjangoModelFactory):
     password = fuzzy.FuzzyText(length=10)
     phone_number = factory.LazyAttribute(lambda o: generate_phone_number_string())
 
+    @classmethod
+    def bulk_attributes(cls, index: int) -> dict:
+        # 모든 사용자가 같은 비밀번호: hash는 한 번만 계산
+        return {
+            "email": f"user{index}@example.com",
+            "username": f"user{index}",
+            "nickname": f"user{index}",
+            "phone_number": sequence_phone_number(index),
+            "password": bulk_password_hash()
+        }
 
-class AuthOtpFactory(factory.django.DjangoModelFactory):
+
+class AuthOtpFactory(BulkFactoryMixin, factory.django.DjangoModelFactory):
     class Meta:
         model = AuthOtp
         django_get_or_create = ["number"]
@@ -37,3 +105,7 @@ class AuthOtpFactory(factory.django.DjangoModelFactory):
     number = factory.LazyAttribute(lambda o: "-".join(["010", _rand_str(), _rand_str()]))
     otp_key = factory.LazyAttribute(lambda o: pyotp.random_base32())
     authenticated = factory.LazyAttribute(lambda o: random.getrandbits(0))
+
+    @classmethod
+    def bulk_attributes(cls, index: int) -> dict:
+        return {"number": sequence_phone_number(index)}
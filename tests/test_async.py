@@ -0,0 +1,149 @@
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.contrib.auth.hashers import make_password
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework import status
+
+from .factories import UserFactory, AuthOtpFactory, generate_phone_number_string, sent_otp_code, sms_outbox
+from users.models import User, AuthOtp
+from users.api.authentication import user_snapshot_cache
+from project.conf import app_settings
+
+
+@sms_outbox
+@override_settings(ROOT_URLCONF="project.asgi_urls")
+class AsyncViewTestCase(TestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        user_snapshot_cache.clear()
+
+    async def post(self, path: str, data: dict, **extra):
+        return await self.async_client.post(path, data, content_type="application/json", **extra)
+
+    async def put(self, path: str, data: dict, **extra):
+        return await self.async_client.put(path, data, content_type="application/json", **extra)
+
+    async def test_async_send_and_verify_code(self):
+        number = generate_phone_number_string()
+
+        # 성공: 인증번호 발송
+        response = await self.post("/auth/send_code/", {"number": number})
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()["data"]
+        assert data["number"] == number
+        assert "otp_code" not in data
+        code = sent_otp_code(number)
+
+        # 실패: 잘못된 인증번호
+        response = await self.post("/auth/verify_code/", {"number": number, "otp_code": "000000"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "invalid_code" in response.json()["fail_case"]
+
+        # 성공: 인증번호 확인
+        response = await self.post("/auth/verify_code/", {"number": number, "otp_code": code})
+        assert response.status_code == status.HTTP_200_OK
+        auth = await AuthOtp.objects.alatest_for(number)
+        assert auth.otp_register_code == code
+
+        # 실패: 인증 정보가 없는 번호
+        response = await self.post(
+            "/auth/verify_code/",
+            {"number": generate_phone_number_string(), "otp_code": code}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "invalid_number" in response.json()["fail_case"]
+
+    async def test_async_signup_and_login(self):
+        auth: AuthOtp = await sync_to_async(AuthOtpFactory.create)()
+        await self.post("/auth/verify_code/", {"number": auth.number, "otp_code": auth.otp_code})
+        data = {
+            "phone_number": auth.number,
+            "otp_register_code": auth.otp_code,
+            "email": "email@gmail.com",
+            "username": "username",
+            "nickname": "nickname",
+            "password": "password"
+        }
+
+        # 성공: 회원가입
+        response = await self.post("/user/signup/", data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["data"]["email"] == data["email"]
+        assert await User.objects.filter(email=data["email"]).aexists()
+
+        # 성공: 로그인
+        response = await self.post("/user/login/", {"email": data["email"], "password": "password"})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["data"]["user"]["email"] == data["email"]
+        assert "access" in response.json()["data"]
+
+        # 실패: 잘못된 비밀번호로 로그인
+        response = await self.post("/user/login/", {"email": data["email"], "password": "wrong"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "wrong_password" in response.json()["fail_case"]
+
+        # 실패: 존재하지 않는 사용자
+        response = await self.post("/user/login/", {"email": "none@example.com", "password": "password"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "no_exist_user" in response.json()["fail_case"]
+
+    async def test_async_user_detail(self):
+        auth: AuthOtp = await sync_to_async(AuthOtpFactory.create)()
+        await self.post("/auth/verify_code/", {"number": auth.number, "otp_code": auth.otp_code})
+        user: User = await sync_to_async(UserFactory.create)(
+            phone_number=auth.number,
+            otp_register_code=auth.otp_code,
+            password=make_password("password")
+        )
+
+        # 실패: 인증 정보 없이 조회 / 수정
+        response = await self.async_client.get("/user/detail/")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "not_authenticated" in response.json()["fail_case"]
+        response = await self.put("/user/detail/", {"nickname": "new_nickname"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "not_authenticated" in response.json()["fail_case"]
+
+        response = await self.post("/user/login/", {"email": user.email, "password": "password"})
+        headers = {"AUTHORIZATION": "Bearer " + response.json()["data"]["access"]}
+
+        # 성공: 조회
+        response = await self.async_client.get("/user/detail/", **headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["user"]["email"] == user.email
+
+        # 성공: 수정
+        response = await self.put(
+            "/user/detail/", {"nickname": "new_nickname"}, **headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["nickname"] == "new_nickname"
+
+        # 실패: 인증하지 않은 번호로 변경 (signal의 ValidationError → 400)
+        response = await self.put("/user/detail/", {"phone_number": generate_phone_number_string()}, **headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "invalid_number" in response.json()["fail_case"]
+
+    async def test_export_not_served(self):
+        # 실패: 스트리밍 export는 ASGI urlconf에서 제공하지 않음
+        response = await self.async_client.get("/user/export/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class AsgiApplicationTestCase(SimpleTestCase):
+    async def test_asgi_urlconf(self):
+        from project.asgi import application
+
+        # 성공: settings.ROOT_URLCONF와 무관하게 ASGI 요청은 async view urlconf로 처리 (export는 WSGI 전용)
+        communicator = ApplicationCommunicator(application, {
+            "type": "http",
+            "method": "GET",
+            "path": "/user/export/",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+        })
+        await communicator.send_input({"type": "http.request"})
+        response = await communicator.receive_output(1)
+        assert response["status"] == status.HTTP_404_NOT_FOUND
+        await communicator.wait()
@@ -1,12 +1,30 @@
+import io
 import time
+import datetime
+import threading
+import pyotp
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
-from .factories import _rand_str, generate_phone_number_string
+from tests.bench import benchmark, report
+from .factories import _rand_str, generate_phone_number_string, sent_otp_code, sms_outbox
+from users import otp
+from users.choices import AuthOtpTypeEnum
+from users.models import AuthOtp
+from users.notifications import LocMemSMSProvider, sms_dispatcher
+from users.otp_backends import InMemoryOtpBackend, get_otp_backend
 from project.conf import app_settings
 
 
+@sms_outbox
 class AuthTestCase(APITestCase):
     def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
         self.client = APIClient()
         self.url_prefix = "http://127.0.0.1:8000/auth/"
 
@@ -32,8 +50,8 @@ class AuthTestCase(APITestCase):
         url = self.url_prefix + "verify_code/"
 
         number = generate_phone_number_string()
-        send_code_response = self.client.post(self.url_prefix + "send_code/", {"number": number})
-        code = send_code_response.data.get('otp_code')
+        self.client.post(self.url_prefix + "send_code/", {"number": number})
+        code = sent_otp_code(number)
 
         # 성공
         response = self.client.post(url, {"number": number, "otp_code": code})
@@ -57,15 +75,17 @@ class AuthTestCase(APITestCase):
         assert "invalid_number" in response.data
 
         # 실패: 잘못된 코드로 인증을 시도하는 경우
-        send_code_response = self.client.post(self.url_prefix + "send_code/", {"number": number})
-        code = send_code_response.data.get('otp_code')[:-1]
+        self.client.post(self.url_prefix + "send_code/", {"number": number})
+        code = sent_otp_code(number)[:-1]
         response = self.client.post(url, {"number": number, "otp_code": code})
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "invalid_code" in response.data
 
 
+@sms_outbox
 class ThrottlingTestCase(APITestCase):
     def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
         self.client = APIClient()
         self.url_prefix = "http://127.0.0.1:8000/auth/"
 
@@ -88,10 +108,395 @@ class ThrottlingTestCase(APITestCase):
     def test_throttling_time_interval(self):
         # 실패: 인증이 가능한 시간을 초과한 경우
         number = generate_phone_number_string()
-        send_code_response = self.client.post(self.url_prefix + "send_code/", {"number": number})
-        code = send_code_response.data.get('otp_code')
+        self.client.post(self.url_prefix + "send_code/", {"number": number})
+        code = sent_otp_code(number)
 
         time_interval = int(app_settings.OTP_TIME_INTERVAL)
         time.sleep(time_interval)
         response = self.client.post(self.url_prefix + "verify_code/", {"number": number, "otp_code": code}, format='json')
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class AuthOtpManagerTestCase(APITestCase):
+    def test_latest_for(self):
+        number = generate_phone_number_string()
+        AuthOtp.objects.create(number=number, auth_type=AuthOtpTypeEnum.EMAIL.value)
+        password_reset = AuthOtp.objects.create(number=number, auth_type=AuthOtpTypeEnum.PASSWORD_RESET.value)
+
+        # 성공: 조건에 맞는 가장 최근의 인증정보를 하나의 쿼리로 조회
+        with self.assertNumQueries(1):
+            auth_otp = AuthOtp.objects.latest_for(number)
+        assert auth_otp.pk == password_reset.pk
+
+        auth_otp = AuthOtp.objects.latest_for(number, auth_type=AuthOtpTypeEnum.EMAIL.value, authenticated=False)
+        assert auth_otp.auth_type == AuthOtpTypeEnum.EMAIL.value
+
+        # 실패: 조건에 맞는 인증정보가 없는 경우
+        with self.assertRaises(AuthOtp.DoesNotExist):
+            AuthOtp.objects.latest_for(number, authenticated=True)
+
+    def test_purge_expired(self):
+        now = timezone.now()
+        auth_otps = [AuthOtp.objects.create(number=generate_phone_number_string()) for _ in range(5)]
+        for i, auth_otp in enumerate(auth_otps):
+            AuthOtp.objects.filter(pk=auth_otp.pk).update(timestamp=now - datetime.timedelta(days=i * 2))
+
+        # 성공: 보관 기간이 지난 인증정보만 batch 단위로 삭제
+        out = io.StringIO()
+        call_command("purge_auth_otps", "--horizon", str(3 * 24 * 60 * 60), "--batch-size", "1", stdout=out)
+        assert "purged 3 rows" in out.getvalue()
+        assert "deleted 1 rows" in out.getvalue()
+        assert set(AuthOtp.objects.values_list("pk", flat=True)) == {auth_otps[0].pk, auth_otps[1].pk}
+
+        # 성공: dry-run은 삭제하지 않음
+        out = io.StringIO()
+        call_command("purge_auth_otps", "--horizon", "0", "--dry-run", stdout=out)
+        assert out.getvalue().startswith("1 rows")
+        assert AuthOtp.objects.count() == 2
+
+
+class AuthOtpLookupBenchmarkTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.client = APIClient()
+        self.url_prefix = "http://127.0.0.1:8000/auth/"
+
+    def _seed(self, number, size):
+        AuthOtp.objects.bulk_create([
+            AuthOtp(number=number, otp_key=pyotp.random_base32(), authenticated=True) for _ in range(size)
+        ])
+        return AuthOtp.objects.create(number=number)
+
+    def _verify(self, number, code):
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = self.client.post(self.url_prefix + "verify_code/", {"number": number, "otp_code": code})
+            elapsed = time.perf_counter() - start
+        assert response.status_code == status.HTTP_200_OK
+        return len(context.captured_queries), elapsed
+
+    def _verify_sizes(self, sizes):
+        results = []
+        for size in sizes:
+            number = generate_phone_number_string()
+            auth_otp = self._seed(number, size)
+            results.append(self._verify(number, auth_otp.otp_code))
+        return results
+
+    def test_verify_code_query_count(self):
+        # 성공: 번호별 인증정보 수와 무관하게 쿼리 수가 일정
+        query_counts = {count for count, _ in self._verify_sizes((1, 100))}
+        assert len(query_counts) == 1
+
+    @benchmark
+    def test_verify_code_lookup_is_constant(self):
+        results = self._verify_sizes((1, 100, 2000))
+        report("verify_code: " + " ".join(f"{size}={elapsed * 1000:.2f}ms" for size, (_, elapsed) in zip((1, 100, 2000), results)))
+
+        # 성공: 번호별 인증정보 수와 무관하게 응답시간이 일정
+        assert results[-1][1] < results[0][1] * 5 + 0.05
+
+
+class OtpEngineTestCase(SimpleTestCase):
+    def test_generate_and_verify(self):
+        interval = app_settings.OTP_TIME_INTERVAL
+        otp_key = pyotp.random_base32()
+
+        # 성공: pyotp와 동일한 코드와 해당 time window의 만료시각을 함께 계산
+        code, expired_at = otp.generate(otp_key, interval)
+        assert code == pyotp.TOTP(otp_key, interval=interval).now()
+        assert expired_at.timestamp() % interval == 0
+        assert otp.verify(otp_key, interval, code)
+
+        # 성공: 동일한 (otp_key, interval)에 대한 TOTP 객체 재사용
+        assert otp.get_totp(otp_key, interval) is otp.get_totp(otp_key, interval)
+
+        # 실패: 잘못된 코드 / 만료된 코드
+        assert not otp.verify(otp_key, interval, code[:-1])
+        assert not otp.verify(otp_key, interval, code, for_time=expired_at)
+
+    def test_verify_many(self):
+        interval = app_settings.OTP_TIME_INTERVAL
+        otp_keys = [pyotp.random_base32() for _ in range(3)]
+        items = [(otp_key, otp.generate(otp_key, interval)[0]) for otp_key in otp_keys]
+        items.append((otp_keys[0], "000000" if items[0][1] != "000000" else "111111"))
+
+        assert otp.verify_many(items, interval) == [True, True, True, False]
+
+
+class FlakySMSProvider(LocMemSMSProvider):
+    calls = 0
+    failures = 2
+
+    def send_messages(self, messages):
+        FlakySMSProvider.calls += 1
+        if FlakySMSProvider.calls <= self.failures:
+            raise ConnectionError("sms_provider_unavailable")
+        return super().send_messages(messages)
+
+
+class BlockingSMSProvider(LocMemSMSProvider):
+    entered = threading.Event()
+    released = threading.Event()
+
+    def send_messages(self, messages):
+        self.entered.set()
+        self.released.wait(5)
+        return super().send_messages(messages)
+
+
+@override_settings(SMS_PROVIDER="users.notifications.LocMemSMSProvider", SMS_WORKERS=0, SMS_RETRY_BACKOFF=0)
+class SMSDispatcherTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        LocMemSMSProvider.reset()
+        self.client = APIClient()
+
+    def tearDown(self) -> None:
+        sms_dispatcher.stop()
+
+    def test_send_code_dispatch(self):
+        # 성공: 응답과 같은 인증번호가 발송됨
+        number = generate_phone_number_string()
+        response = self.client.post("http://127.0.0.1:8000/auth/send_code/", {"number": number})
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(LocMemSMSProvider.outbox) == 1
+        assert LocMemSMSProvider.outbox[0].number == number
+        assert "otp_code" not in response.data
+        assert response.data["expired_at"] in LocMemSMSProvider.outbox[0].body
+
+        # 성공: local / load test 설정에서만 응답에 인증번호 포함
+        with override_settings(OTP_CODE_IN_RESPONSE=True):
+            response = self.client.post("http://127.0.0.1:8000/auth/send_code/", {"number": number})
+        assert response.data["otp_code"] == sent_otp_code(number)
+        LocMemSMSProvider.reset()
+
+        # 성공: 비밀번호 재설정 인증번호도 발송됨
+        response = self.client.post(
+            "http://127.0.0.1:8000/passwd/request_code/", {"number": number}, format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(LocMemSMSProvider.outbox) == 1
+
+    def test_batching(self):
+        BlockingSMSProvider.entered.clear()
+        BlockingSMSProvider.released.clear()
+        with override_settings(SMS_PROVIDER="tests.test_auth.BlockingSMSProvider", SMS_WORKERS=1, SMS_BATCH_SIZE=3):
+            # 성공: 첫 발송이 지연되는 동안 쌓인 메시지는 SMS_BATCH_SIZE 단위로 묶여 발송됨
+            assert sms_dispatcher.send(generate_phone_number_string(), "message")
+            assert BlockingSMSProvider.entered.wait(5)
+            for i in range(6):
+                assert sms_dispatcher.send(generate_phone_number_string(), f"message {i}")
+            BlockingSMSProvider.released.set()
+            sms_dispatcher.join()
+        assert len(LocMemSMSProvider.outbox) == 7
+        assert LocMemSMSProvider.batches == [1, 3, 3]
+
+    def test_retry(self):
+        FlakySMSProvider.calls = 0
+        with override_settings(SMS_PROVIDER="tests.test_auth.FlakySMSProvider", SMS_MAX_RETRIES=2):
+            # 성공: 실패한 발송은 SMS_MAX_RETRIES 만큼 재시도
+            sms_dispatcher.send(generate_phone_number_string(), "message")
+            assert FlakySMSProvider.calls == 3
+            assert len(LocMemSMSProvider.outbox) == 1
+
+        FlakySMSProvider.calls = 0
+        with override_settings(SMS_PROVIDER="tests.test_auth.FlakySMSProvider", SMS_MAX_RETRIES=1):
+            # 실패: 재시도 횟수를 넘기면 발송을 포기하고 요청은 실패하지 않음
+            with self.assertLogs("users.notifications", level="ERROR"):
+                sms_dispatcher.send(generate_phone_number_string(), "message")
+            assert FlakySMSProvider.calls == 2
+            assert len(LocMemSMSProvider.outbox) == 1
+
+    def test_slow_provider_does_not_block_request(self):
+        BlockingSMSProvider.released.clear()
+        with override_settings(SMS_PROVIDER="tests.test_auth.BlockingSMSProvider", SMS_WORKERS=1):
+            # 성공: provider가 응답하지 않아도 인증번호 요청은 바로 반환됨
+            started_at = time.perf_counter()
+            response = self.client.post(
+                "http://127.0.0.1:8000/auth/send_code/",
+                {"number": generate_phone_number_string()}
+            )
+            elapsed = time.perf_counter() - started_at
+            assert response.status_code == status.HTTP_201_CREATED
+            assert elapsed < 1
+            assert LocMemSMSProvider.outbox == []
+
+            BlockingSMSProvider.released.set()
+            sms_dispatcher.join()
+            assert len(LocMemSMSProvider.outbox) == 1
+
+
+@sms_outbox
+class OtpBackendTestCase(APITestCase):
+    backends = ["users.otp_backends.ModelOtpBackend", "users.otp_backends.InMemoryOtpBackend"]
+
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        InMemoryOtpBackend.reset()
+        self.client = APIClient()
+
+    def test_backend(self):
+        for backend_path in self.backends:
+            with self.subTest(backend=backend_path), override_settings(OTP_BACKEND=backend_path):
+                backend = get_otp_backend()
+                number = generate_phone_number_string()
+
+                # 성공: 인증되지 않은 인증정보는 재사용
+                auth_otp = backend.issue(number, AuthOtpTypeEnum.EMAIL.value)
+                assert backend.issue(number, AuthOtpTypeEnum.EMAIL.value).pk == auth_otp.pk
+                assert backend.latest(number).otp_key == auth_otp.otp_key
+
+                # 실패: 잘못된 인증번호
+                assert not backend.verify(auth_otp, "000000")
+                assert backend.latest(number).otp_register_code is None
+
+                # 성공: 인증번호 등록
+                code = auth_otp.otp_code
+                assert backend.verify(auth_otp, code)
+                assert backend.latest(number).otp_register_code == code
+
+                # 성공: 인증 완료 처리는 한 번만 성공
+                assert backend.mark_authenticated(backend.latest(number))
+                assert not backend.mark_authenticated(backend.latest(number))
+                with self.assertRaises(AuthOtp.DoesNotExist):
+                    backend.latest(number, authenticated=False)
+                with self.assertRaises(AuthOtp.DoesNotExist):
+                    backend.latest(generate_phone_number_string())
+
+    def test_backend_latest_matches_filters(self):
+        for backend_path in self.backends:
+            with self.subTest(backend=backend_path), override_settings(OTP_BACKEND=backend_path):
+                backend = get_otp_backend()
+                number = generate_phone_number_string()
+                signup = backend.create(number, AuthOtpTypeEnum.EMAIL.value)
+                backend.mark_authenticated(signup)
+                reset = backend.create(number, AuthOtpTypeEnum.PASSWORD_RESET.value)
+
+                # 성공: 최신 인증정보가 조건에 맞지 않으면 조건에 맞는 그 이전 인증정보
+                assert backend.latest(number).pk == reset.pk
+                assert backend.latest(number, authenticated=True).pk == signup.pk
+                assert backend.latest(number, authenticated=False).pk == reset.pk
+                assert backend.latest(number, auth_type=AuthOtpTypeEnum.EMAIL.value).pk == signup.pk
+
+                # 실패: 조건에 맞는 인증정보가 없음
+                with self.assertRaises(AuthOtp.DoesNotExist):
+                    backend.latest(number, auth_type=AuthOtpTypeEnum.EMAIL.value, authenticated=False)
+
+                # 성공: 새 인증정보를 발급하면 인증되지 않은 인증정보 중 가장 최근 것
+                retry = backend.create(number, AuthOtpTypeEnum.EMAIL.value)
+                backend.mark_authenticated(reset)
+                assert backend.latest(number, authenticated=False).pk == retry.pk
+                assert backend.latest(number, authenticated=True).pk == reset.pk
+                with self.assertRaises(AuthOtp.DoesNotExist):
+                    backend.latest(number, auth_type=AuthOtpTypeEnum.PASSWORD_RESET.value, authenticated=False)
+
+    def test_cache_backend_register_is_compare_and_set(self):
+        backend = InMemoryOtpBackend()
+        auth_otp = backend.create(generate_phone_number_string(), AuthOtpTypeEnum.EMAIL.value)
+
+        # 성공: 동시에 등록을 시도하면 먼저 등록된 인증번호만 유지
+        results = []
+        threads = [
+            threading.Thread(target=lambda c=code: results.append((c, backend.register(auth_otp, c))))
+            for code in ("111111", "222222", "333333", "444444")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        winners = [code for code, registered in results if registered]
+        assert len(winners) == 1
+        assert backend.latest(auth_otp.number).otp_register_code == winners[0]
+
+    @override_settings(OTP_BACKEND="users.otp_backends.InMemoryOtpBackend")
+    def test_cache_backend_signup_flow(self):
+        number = generate_phone_number_string()
+
+        # 성공: 인증번호 발송, 확인, 회원가입 동안 AuthOtp 테이블을 사용하지 않음
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post("http://127.0.0.1:8000/auth/send_code/", {"number": number})
+            assert response.status_code == status.HTTP_201_CREATED
+            code = sent_otp_code(number)
+            response = self.client.post("http://127.0.0.1:8000/auth/verify_code/", {"number": number, "otp_code": code})
+            assert response.status_code == status.HTTP_200_OK
+            response = self.client.post("http://127.0.0.1:8000/user/signup/", {
+                "phone_number": number,
+                "otp_register_code": code,
+                "email": "otp_backend@example.com",
+                "username": "username",
+                "nickname": "nickname",
+                "password": "password"
+            })
+            assert response.status_code == status.HTTP_201_CREATED
+        assert not [query for query in context.captured_queries if AuthOtp._meta.db_table in query["sql"]]
+        assert AuthOtp.objects.count() == 0
+
+        # 실패: 이미 회원가입에 사용된 인증정보
+        response = self.client.post("http://127.0.0.1:8000/user/signup/", {
+            "phone_number": number,
+            "otp_register_code": code,
+            "email": "otp_backend2@example.com",
+            "username": "username",
+            "nickname": "nickname",
+            "password": "password"
+        })
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@sms_outbox
+class OtpVerifyConcurrencyTestCase(TransactionTestCase):
+    backends = ["users.otp_backends.ModelOtpBackend", "users.otp_backends.InMemoryOtpBackend"]
+    concurrency = 8
+
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        InMemoryOtpBackend.reset()
+
+    def run_concurrently(self, func) -> list:
+        barrier, results = threading.Barrier(self.concurrency), []
+
+        def target():
+            try:
+                barrier.wait()
+                results.append(func())
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=target) for _ in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_verify(self):
+        for backend_path in self.backends:
+            with self.subTest(backend=backend_path), override_settings(OTP_BACKEND=backend_path):
+                backend = get_otp_backend()
+                auth_otp = backend.issue(generate_phone_number_string(), AuthOtpTypeEnum.EMAIL.value)
+                code = auth_otp.otp_code
+
+                # 성공: 같은 번호에 대한 동시 인증 요청 중 한 요청만 인증번호를 등록
+                results = self.run_concurrently(lambda: backend.verify(backend.latest(auth_otp.number), code))
+                assert sorted(results) == [False] * (self.concurrency - 1) + [True]
+                assert backend.latest(auth_otp.number).otp_register_code == code
+
+                # 실패: 등록 여부를 모르는 (오래된) 인증정보로 다시 인증
+                auth_otp.otp_register_code = None
+                assert not backend.verify(auth_otp, code)
+
+    def test_verify_code_endpoint(self):
+        number = generate_phone_number_string()
+        APIClient().post("http://127.0.0.1:8000/auth/send_code/", {"number": number})
+        code = sent_otp_code(number)
+
+        # 성공: 동시에 요청한 인증 중 하나만 성공하고 나머지는 invalid_code
+        responses = self.run_concurrently(lambda: APIClient().post(
+            "http://127.0.0.1:8000/auth/verify_code/",
+            {"number": number, "otp_code": code}
+        ))
+        status_codes = sorted(response.status_code for response in responses)
+        assert status_codes == [status.HTTP_200_OK] + [status.HTTP_400_BAD_REQUEST] * (self.concurrency - 1)
+        assert all("invalid_code" in response.data for response in responses if response.status_code != 200)
+        assert AuthOtp.objects.get(number=number).otp_register_code == code
@@ -0,0 +1,73 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from users.models import AuthOtp, User
+from utils.routers import ReplicaRouter, read_replica
+from project.conf import DatabaseSettings
+
+
+class DatabaseSettingsTestCase(SimpleTestCase):
+    def test_defaults(self):
+        # 성공: 연결 재사용 / 상태 확인이 기본값
+        databases = DatabaseSettings({}).databases()
+        assert list(databases) == ["default"]
+        default = databases["default"]
+        assert default["HOST"] == "db"
+        assert default["CONN_MAX_AGE"] == 60
+        assert default["CONN_HEALTH_CHECKS"] is True
+        assert "DISABLE_SERVER_SIDE_CURSORS" not in default
+
+    def test_environ(self):
+        databases = DatabaseSettings({
+            "POSTGRES_HOST": "pgbouncer",
+            "POSTGRES_PORT": "6432",
+            "POSTGRES_CONN_MAX_AGE": "0",
+            "POSTGRES_CONN_HEALTH_CHECKS": "false",
+            "POSTGRES_POOL": "pgbouncer",
+            "POSTGRES_REPLICA_HOSTS": "replica1:5433, replica2",
+        }).databases()
+
+        # 성공: PgBouncer (transaction pooling) 에서는 서버 측 cursor 비활성화
+        default = databases["default"]
+        assert (default["HOST"], default["PORT"]) == ("pgbouncer", "6432")
+        assert default["CONN_MAX_AGE"] == 0
+        assert default["CONN_HEALTH_CHECKS"] is False
+        assert default["DISABLE_SERVER_SIDE_CURSORS"] is True
+
+        # 성공: replica는 테스트에서 default를 사용
+        assert list(databases) == ["default", "replica_0", "replica_1"]
+        assert (databases["replica_0"]["HOST"], databases["replica_0"]["PORT"]) == ("replica1", "5433")
+        assert (databases["replica_1"]["HOST"], databases["replica_1"]["PORT"]) == ("replica2", "6432")
+        assert databases["replica_1"]["TEST"] == {"MIRROR": "default"}
+
+    def test_invalid(self):
+        # 실패: 지원하지 않는 pool / 숫자가 아닌 값
+        with self.assertRaises(ImproperlyConfigured):
+            DatabaseSettings({"POSTGRES_POOL": "pgpool"}).databases()
+        with self.assertRaises(ImproperlyConfigured):
+            DatabaseSettings({"POSTGRES_POOL": "psycopg"}).databases()
+        with self.assertRaises(ImproperlyConfigured):
+            DatabaseSettings({"POSTGRES_CONN_MAX_AGE": "forever"}).databases()
+
+
+class ReplicaRouterTestCase(SimpleTestCase):
+    def test_no_replicas(self):
+        router = ReplicaRouter()
+        with read_replica():
+            assert router.db_for_read(User) is None
+        assert router.db_for_write(User) == "default"
+
+    @override_settings(DATABASE_REPLICAS=["replica_0"])
+    def test_read_replica(self):
+        router = ReplicaRouter()
+
+        # 성공: read_replica() 안의 조회만 replica 사용
+        assert router.db_for_read(AuthOtp) is None
+        with read_replica():
+            assert router.db_for_read(User) == "replica_0"
+        assert router.db_for_read(User) is None
+
+        # 성공: 쓰기 / migration은 primary에서만
+        assert router.db_for_write(User) == "default"
+        assert router.allow_migrate("default", "users")
+        assert not router.allow_migrate("replica_0", "users")
@@ -0,0 +1,80 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from .factories import generate_phone_number_string
+from utils.metrics import Histogram, MetricsRegistry, registry
+from project.conf import app_settings
+
+
+class HistogramTestCase(SimpleTestCase):
+    def test_render(self):
+        metrics = MetricsRegistry()
+        for value in (0, 1, 1, 4, 100):
+            metrics.observe("db_queries_per_request", "auth-send-code", value)
+
+        # 성공: 누적 bucket / sum / count를 Prometheus text 형식으로 출력
+        text = metrics.render()
+        assert "# TYPE db_queries_per_request histogram" in text
+        assert 'db_queries_per_request_bucket{action="auth-send-code",le="0"} 1' in text
+        assert 'db_queries_per_request_bucket{action="auth-send-code",le="1"} 3' in text
+        assert 'db_queries_per_request_bucket{action="auth-send-code",le="5"} 4' in text
+        assert 'db_queries_per_request_bucket{action="auth-send-code",le="+Inf"} 5' in text
+        assert 'db_queries_per_request_sum{action="auth-send-code"} 106' in text
+        assert 'db_queries_per_request_count{action="auth-send-code"} 5' in text
+
+    def test_observe(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+
+
+@override_settings(METRICS_ENABLED=True)
+class MetricsMiddlewareTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        registry.reset()
+        self.client = APIClient()
+        self.url_prefix = "http://127.0.0.1:8000/"
+
+    def test_action_metrics(self):
+        # 성공: action 별 query 수, SQL / serializer / render / throttle 시간 기록
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url_prefix + "auth/send_code/", {"number": generate_phone_number_string()})
+        assert response.status_code == status.HTTP_201_CREATED
+
+        action = "auth-send-code"
+        queries = registry.get("db_queries_per_request", action)
+        assert queries.count == 1
+        assert queries.sum == len(context.captured_queries)
+        assert registry.get("db_query_duration_seconds", action).sum > 0
+        for name in ("http_request_duration_seconds", "serializer_duration_seconds",
+                     "render_duration_seconds", "throttle_duration_seconds"):
+            histogram = registry.get(name, action)
+            assert histogram.count == 1
+            assert histogram.sum > 0
+        assert registry.get("serializer_duration_seconds", action).sum < \
+            registry.get("http_request_duration_seconds", action).sum
+
+        # 성공: /metrics 에서 Prometheus text 형식으로 조회
+        response = self.client.get(self.url_prefix + "metrics")
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert f'db_queries_per_request_count{{action="{action}"}} 1' in response.content.decode()
+
+        # 실패: 허용되지 않은 주소에서 조회
+        with override_settings(METRICS_ALLOWED_IPS=["10.0.0.1"]):
+            response = self.client.get(self.url_prefix + "metrics")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled(self):
+        # 성공: 비활성화된 경우 기록하지 않음
+        self.client.post(self.url_prefix + "auth/send_code/", {"number": generate_phone_number_string()})
+        assert registry.get("db_queries_per_request", "auth-send-code") is None
+        assert self.client.get(self.url_prefix + "metrics").status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,40 @@
+import json
+import uuid
+import decimal
+import datetime
+from types import SimpleNamespace
+from django.test import SimpleTestCase, override_settings
+from rest_framework import status
+
+from utils.renderers import ResponseRenderer
+
+
+class ResponseRendererTestCase(SimpleTestCase):
+    def _render(self, data, status_code):
+        context = {"response": SimpleNamespace(status_code=status_code)}
+        return ResponseRenderer().render(data, renderer_context=context)
+
+    def test_render(self):
+        data = {
+            "id": uuid.UUID(int=1),
+            "amount": decimal.Decimal("1.50"),
+            "last_login_datetime": datetime.datetime(2022, 11, 1, 9, 30, tzinfo=datetime.timezone.utc),
+            "nickname": "닉네임",
+        }
+        for backend in ("json", "orjson"):
+            with override_settings(RESPONSE_JSON_BACKEND=backend):
+                # 성공: envelope를 bytes로 직접 직렬화
+                content = self._render(data, status.HTTP_200_OK)
+                assert isinstance(content, bytes)
+                assert json.loads(content) == {
+                    "status": "success",
+                    "data": {
+                        "id": str(uuid.UUID(int=1)),
+                        "amount": "1.50",
+                        "last_login_datetime": "2022-11-01T09:30:00+00:00",
+                        "nickname": "닉네임",
+                    }
+                }
+
+                content = self._render(["invalid_number"], status.HTTP_400_BAD_REQUEST)
+                assert json.loads(content) == {"status": "fail", "fail_case": ["invalid_number"]}
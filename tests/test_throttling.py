@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from project.conf import app_settings
+from users.api.exceptions import Throttled
+from utils.throttling import (
+    AnonRateThrottle,
+    ScopedRateThrottle,
+    AnonGCRAThrottle,
+    ScopedGCRAThrottle
+)
+
+THROTTLE_FAMILIES = [(AnonRateThrottle, ScopedRateThrottle), (AnonGCRAThrottle, ScopedGCRAThrottle)]
+
+
+class SharedRateThrottleTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.request = APIRequestFactory().post("/auth/send_code/")
+        self.request.user = AnonymousUser()
+        self.now = 1_000_000.0
+
+    def _throttle(self, throttle_class):
+        throttle = throttle_class()
+        throttle.timer = lambda: self.now
+        return throttle
+
+    def test_scopes(self):
+        # 성공: 설정된 모든 throttling 범위가 공유 저장소 기반으로 동작
+        for _, scoped_throttle in THROTTLE_FAMILIES:
+            caches[app_settings.THROTTLE_CACHE].clear()
+            for scope, rate in app_settings.REST_FRAMEWORK_DEFAULT_THROTTLE_RATES.items():
+                if rate is None:
+                    continue
+                view = SimpleNamespace(throttle_scope=scope)
+                num = int(rate.split('/')[0])
+                for i in range(num):
+                    assert self._throttle(scoped_throttle).allow_request(self.request, view)
+
+                # 실패: 범위를 초과하는 요청
+                throttle = self._throttle(scoped_throttle)
+                assert not throttle.allow_request(self.request, view)
+                assert 0 < throttle.wait() <= throttle.duration * 2
+                assert 0 < Throttled(throttle.wait()).wait
+
+    def test_shared_between_workers(self):
+        for anon_throttle, _ in THROTTLE_FAMILIES:
+            caches[app_settings.THROTTLE_CACHE].clear()
+            self._test_shared_between_workers(anon_throttle)
+
+    def _test_shared_between_workers(self, anon_throttle):
+        num, duration = anon_throttle().parse_rate(app_settings.REST_FRAMEWORK_DEFAULT_THROTTLE_RATES['anon'])
+        workers = [self._throttle(anon_throttle) for _ in range(4)]
+
+        # 성공: 여러 worker에서 들어온 요청이 하나의 제한을 공유
+        for i in range(num):
+            assert workers[i % len(workers)].allow_request(self.request, None)
+        assert not workers[0].allow_request(self.request, None)
+
+        # 성공: 거부된 요청은 횟수에 포함되지 않으며, 안내된 대기시간 이후 다시 허용
+        wait = workers[0].wait()
+        self.now += wait
+        assert self._throttle(anon_throttle).allow_request(self.request, None)
+
+        # 성공: 두 window가 지나면 제한이 초기화
+        self.now += duration * 2
+        for i in range(num):
+            assert self._throttle(anon_throttle).allow_request(self.request, None)
@@ -1,15 +1,45 @@
+import csv
+import io
+import json
+import os
+import tempfile
+
+from asgiref.sync import async_to_sync
 from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from factory import fuzzy
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
 
-from users.choices import AuthOtpTypeEnum
-from .factories import UserFactory, AuthOtpFactory, generate_phone_number_string
+from users.choices import AuthOtpTypeEnum, LoginTypeEnum
+from .factories import (
+    UserFactory,
+    AuthOtpFactory,
+    BULK_PASSWORD,
+    generate_phone_number_string,
+    sent_otp_code,
+    sequence_phone_number,
+    sms_outbox
+)
 from users.models import User, AuthOtp
+from users.recorders import LastLoginRecorder
+from users.hashers import password_hashing_executor, password_rehasher
+from users.api.authentication import UserSnapshotCache, user_snapshot_cache
+from users.api.serializers import UserSerializer
+from project.conf import app_settings
 
 
+@sms_outbox
 class UserTestCase(APITestCase):
     def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
         self.client = APIClient()
         self.url_prefix = "http://127.0.0.1:8000/"
 
@@ -68,6 +98,51 @@ class UserTestCase(APITestCase):
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "invalid_number" in response.data
 
+    def test_user_signup_queries(self):
+        auth: AuthOtp = AuthOtpFactory.create(auth_type=AuthOtpTypeEnum.EMAIL.value)
+        self.client.post(
+            self.url_prefix + "auth/verify_code/",
+            {"number": auth.number, "otp_code": auth.otp_code}
+        )
+        data = {
+            "phone_number": auth.number,
+            "otp_register_code": auth.otp_code,
+            "email": "queries@gmail.com",
+            "username": "queries",
+            "nickname": "queries",
+            "password": "password"
+        }
+
+        # 성공: 인증정보 잠금 조회 1회, 사용자 INSERT, 인증 완료 UPDATE 로 가입
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url_prefix + "user/signup/", data)
+        assert response.status_code == status.HTTP_201_CREATED
+        queries = [q["sql"] for q in context.captured_queries if "SAVEPOINT" not in q["sql"]]
+        assert len(queries) == 3
+        assert queries[0].startswith("SELECT") and '"AuthOtp"' in queries[0]
+        if connection.features.has_select_for_update:
+            assert "FOR UPDATE" in queries[0]
+        assert queries[1].startswith('INSERT INTO "User"')
+        assert queries[2].startswith('UPDATE "AuthOtp" SET "authenticated"')
+
+        auth.refresh_from_db()
+        assert auth.authenticated
+        assert User.objects.get(email="queries@gmail.com").phone_number == auth.number
+
+        # 실패: 이미 가입된 email
+        auth2: AuthOtp = AuthOtpFactory.create(auth_type=AuthOtpTypeEnum.EMAIL.value)
+        self.client.post(
+            self.url_prefix + "auth/verify_code/",
+            {"number": auth2.number, "otp_code": auth2.otp_code}
+        )
+        response = self.client.post(self.url_prefix + "user/signup/", {
+            **data, "phone_number": auth2.number, "otp_register_code": auth2.otp_code
+        })
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "duplicated_email" in response.data
+        auth2.refresh_from_db()
+        assert not auth2.authenticated
+
     def test_user_login(self):
         url = self.url_prefix + "user/login/"
 
@@ -196,7 +271,7 @@ class UserTestCase(APITestCase):
         assert response.status_code == status.HTTP_201_CREATED
         assert number == response.data.get("number")
 
-        otp_code = response.data.get("otp_code")
+        otp_code = sent_otp_code(number)
 
         # 실패: 전화번호 인증 완료 이전에 비밀번호를 재설정하려는 경우
         response = self.client.post(
@@ -220,3 +295,492 @@ class UserTestCase(APITestCase):
         )
         assert response.status_code == status.HTTP_200_OK
         assert number == response.data.get("number")
+
+
+class UserLoginLookupTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.client = APIClient()
+        auth: AuthOtp = AuthOtpFactory.create()
+        self.client.post(
+            "http://127.0.0.1:8000/auth/verify_code/",
+            {"number": auth.number, "otp_code": auth.otp_code}
+        )
+        self.user: User = UserFactory.create(
+            phone_number=auth.number,
+            otp_register_code=auth.otp_code,
+            password=make_password("password")
+        )
+
+    def test_get_by_login_type(self):
+        # 성공: 로그인 방식별로 하나의 쿼리로 필요한 필드만 조회
+        for login_type in LoginTypeEnum.choices_list():
+            with self.assertNumQueries(1):
+                user = User.objects.get_by_login_type(login_type, getattr(self.user, login_type))
+                assert user.check_password("password")
+            assert user.pk == self.user.pk
+            assert "otp_register_code" in user.get_deferred_fields()
+
+        # 실패: 존재하지 않는 사용자
+        with self.assertRaises(User.DoesNotExist):
+            User.objects.get_by_login_type(LoginTypeEnum.EMAIL.value, "test@example.com")
+
+
+class UserSaveQueryTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.client = APIClient()
+        self.url_prefix = "http://127.0.0.1:8000/"
+        auth: AuthOtp = AuthOtpFactory.create()
+        self.client.post(
+            self.url_prefix + "auth/verify_code/",
+            {"number": auth.number, "otp_code": auth.otp_code}
+        )
+        self.user: User = UserFactory.create(
+            phone_number=auth.number,
+            otp_register_code=auth.otp_code,
+            password=make_password("password")
+        )
+
+    def _auth_otp_queries(self, context):
+        return [query for query in context.captured_queries if AuthOtp._meta.db_table in query["sql"]]
+
+    def test_login_and_profile_update_queries(self):
+        # 성공: 로그인 시 사용자 조회와 마지막 로그인 정보 갱신 쿼리만 수행
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                self.url_prefix + "user/login/",
+                {"email": self.user.email, "password": "password"}
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(context.captured_queries) == 1 + int(bool(app_settings.SIMPLE_JWT_UPDATE_LOGIN_SETTING))
+        assert not self._auth_otp_queries(context)
+
+        # 성공: 전화번호를 변경하지 않는 내 정보 수정 시 인증정보를 조회하지 않음
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data.get("access")}')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(self.url_prefix + "user/detail/", {"nickname": "new_nickname"})
+        assert response.status_code == status.HTTP_200_OK
+        assert not self._auth_otp_queries(context)
+
+        # 실패: 인증되지 않은 전화번호로 변경하려는 경우
+        self.user.refresh_from_db()
+        self.user.phone_number = generate_phone_number_string()
+        with self.assertRaises(ValidationError):
+            self.user.save()
+
+
+@override_settings(LAST_LOGIN_DURABILITY="buffered", LAST_LOGIN_FLUSH_INTERVAL=0)
+class LastLoginRecorderTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.recorder = LastLoginRecorder()
+        self.users = []
+        for i in range(3):
+            auth: AuthOtp = AuthOtpFactory.create()
+            self.client.post(
+                "http://127.0.0.1:8000/auth/verify_code/",
+                {"number": auth.number, "otp_code": auth.otp_code}
+            )
+            self.users.append(UserFactory.create(phone_number=auth.number, otp_register_code=auth.otp_code))
+
+    def test_buffered_flush(self):
+        now = timezone.now()
+        # 성공: buffered 모드에서는 요청 경로에서 쓰기를 수행하지 않음
+        with self.assertNumQueries(0):
+            for user in self.users:
+                self.recorder.record(user, LoginTypeEnum.NICKNAME.value, now)
+            self.recorder.record(self.users[0], LoginTypeEnum.USERNAME.value, now)
+        assert self.recorder.pending == len(self.users)
+
+        # 성공: 한 번의 bulk update로 마지막 로그인 정보를 반영
+        with self.assertNumQueries(1):
+            assert self.recorder.flush() == len(self.users)
+        assert self.recorder.pending == 0
+        assert User.objects.get(pk=self.users[0].pk).last_login_type == LoginTypeEnum.USERNAME.value
+        assert User.objects.get(pk=self.users[1].pk).last_login_type == LoginTypeEnum.NICKNAME.value
+        assert User.objects.get(pk=self.users[1].pk).last_login_datetime == now
+
+    @override_settings(LAST_LOGIN_BATCH_SIZE=2)
+    def test_flush_on_batch_size_without_worker(self):
+        now = timezone.now()
+        # 성공: flush 주기가 0이면 batch 크기에 도달한 요청에서 바로 반영
+        self.recorder.record(self.users[0], LoginTypeEnum.NICKNAME.value, now)
+        assert self.recorder.pending == 1
+        with self.assertNumQueries(1):
+            self.recorder.record(self.users[1], LoginTypeEnum.NICKNAME.value, now)
+        assert self.recorder.pending == 0
+        assert User.objects.get(pk=self.users[1].pk).last_login_datetime == now
+
+
+class UserSnapshotCacheTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.client = APIClient()
+        self.url_prefix = "http://127.0.0.1:8000/"
+        user_snapshot_cache.clear()
+        auth: AuthOtp = AuthOtpFactory.create()
+        self.client.post(
+            self.url_prefix + "auth/verify_code/",
+            {"number": auth.number, "otp_code": auth.otp_code}
+        )
+        self.user: User = UserFactory.create(
+            phone_number=auth.number,
+            otp_register_code=auth.otp_code,
+            password=make_password("password")
+        )
+        response = self.client.post(self.url_prefix + "user/login/", {"email": self.user.email, "password": "password"})
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data.get("access")}')
+
+    def test_user_detail_snapshot(self):
+        url = self.url_prefix + "user/detail/"
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        # 성공: 동일한 token으로 조회 시 DB를 조회하지 않음
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        assert response.data.get("user").get("email") == self.user.email
+
+        # 성공: 사용자 정보 변경 시 snapshot이 무효화됨
+        response = self.client.put(url, {"nickname": "new_nickname"})
+        assert response.status_code == status.HTTP_200_OK
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        assert response.data.get("user").get("nickname") == "new_nickname"
+
+    def test_update_uses_fresh_user(self):
+        url = self.url_prefix + "user/detail/"
+        assert self.client.get(url).status_code == status.HTTP_200_OK
+
+        # 다른 worker에서 비밀번호 / 활성화 여부 변경 (이 프로세스에는 post_save 없음)
+        password = make_password("changed")
+        User.objects.filter(pk=self.user.pk).update(password=password, nickname="changed")
+
+        # 성공: 변경 요청은 snapshot이 아닌 DB의 사용자로 처리하고 요청한 필드만 저장
+        response = self.client.put(url, {"username": "new_username"})
+        assert response.status_code == status.HTTP_200_OK
+        user = User.objects.get(pk=self.user.pk)
+        assert user.username == "new_username"
+        assert user.password == password
+        assert user.nickname == "changed"
+
+        # 실패: 비활성화된 사용자의 변경 요청
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        response = self.client.put(url, {"nickname": "new_nickname"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert not User.objects.get(pk=self.user.pk).is_active
+
+    def test_update_unverified_phone_number(self):
+        # 실패: 인증하지 않은 번호로 변경 (signal의 ValidationError → 400)
+        response = self.client.put(self.url_prefix + "user/detail/", {"phone_number": generate_phone_number_string()})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "invalid_number" in response.data
+
+    def test_queryset_update_invalidation(self):
+        url = self.url_prefix + "user/detail/"
+        self.client.get(url)
+
+        # 성공: post_save 없이 갱신하는 경로(로그인 기록 일괄 반영, 비밀번호 재해시)도 snapshot 무효화
+        recorder = LastLoginRecorder()
+        with override_settings(LAST_LOGIN_DURABILITY="buffered", LAST_LOGIN_FLUSH_INTERVAL=0):
+            recorder.record(self.user, LoginTypeEnum.USERNAME.value, timezone.now())
+            recorder.flush()
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        assert response.data.get("user").get("last_login_type") == LoginTypeEnum.USERNAME.value
+
+        user = User.objects.get(pk=self.user.pk)
+        assert password_rehasher.rehash(user.pk, user.password, "password")
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+    def test_invalidation_from_other_worker(self):
+        url = self.url_prefix + "user/detail/"
+        assert self.client.get(url).status_code == status.HTTP_200_OK
+
+        # 다른 worker에서 비활성화 (이 프로세스의 snapshot은 그대로, 공유 cache의 version만 변경)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        UserSnapshotCache().invalidate(self.user.pk)
+
+        # 실패: 공유 version이 바뀐 snapshot은 사용하지 않고 DB에서 다시 확인
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @override_settings(USER_SNAPSHOT_MAX_SIZE=2)
+    def test_bounded_size(self):
+        for i in range(5):
+            user_snapshot_cache.set((self.user.pk, i), self.user, None)
+        assert len(user_snapshot_cache) == 2
+        assert user_snapshot_cache.get((self.user.pk, 0), None) is None
+        assert user_snapshot_cache.get((self.user.pk, 4), None).pk == self.user.pk
+
+        user_snapshot_cache.invalidate(self.user.pk)
+        assert len(user_snapshot_cache) == 0
+
+
+@override_settings(PASSWORD_REHASH_IN_BACKGROUND=False, PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 1000}})
+class PasswordHasherTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.client = APIClient()
+        self.url_prefix = "http://127.0.0.1:8000/"
+        auth: AuthOtp = AuthOtpFactory.create()
+        self.client.post(
+            self.url_prefix + "auth/verify_code/",
+            {"number": auth.number, "otp_code": auth.otp_code}
+        )
+        self.user: User = UserFactory.create(
+            phone_number=auth.number,
+            otp_register_code=auth.otp_code,
+            password=make_password("password")
+        )
+
+    def test_rehash_on_login(self):
+        assert self.user.password.startswith("pbkdf2_sha256$1000$")
+
+        # 성공: 설정된 work factor가 변경되면 로그인 시 비밀번호 해시를 갱신
+        with override_settings(PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 2000}}):
+            response = self.client.post(self.url_prefix + "user/login/", {"email": self.user.email, "password": "password"})
+            assert response.status_code == status.HTTP_201_CREATED
+        self.user.refresh_from_db()
+        assert self.user.password.startswith("pbkdf2_sha256$2000$")
+        assert self.user.check_password("password")
+
+        # 실패: 해시 갱신 전에 비밀번호가 변경된 경우 덮어쓰지 않음
+        assert not password_rehasher.rehash(self.user.pk, "stale_encoded_password", "password")
+
+    def test_async_rehash(self):
+        # 성공: async 검증도 해시를 갱신 (DB 쓰기는 thread_sensitive thread에서)
+        with override_settings(PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 2000}}):
+            assert async_to_sync(self.user.acheck_password)("password")
+            assert not async_to_sync(self.user.acheck_password)("wrong_password")
+        self.user.refresh_from_db()
+        assert self.user.password.startswith("pbkdf2_sha256$2000$")
+
+
+@override_settings(PASSWORD_HASHING_PROCESSES=1, PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 1000}})
+class PasswordHashingExecutorTestCase(SimpleTestCase):
+    def tearDown(self) -> None:
+        password_hashing_executor.shutdown()
+
+    def test_process_pool(self):
+        submitted = password_hashing_executor.metrics()["submitted"]
+
+        # 성공: process pool에서 비밀번호 해시 생성 및 검증
+        encoded = password_hashing_executor.make_password("password")
+        assert encoded.startswith("pbkdf2_sha256$1000$")
+        assert password_hashing_executor.check_password("password", encoded) == (True, False)
+        assert password_hashing_executor.check_password("wrong_password", encoded) == (False, False)
+
+        # 성공: 설정된 work factor와 다른 해시는 갱신 대상
+        with override_settings(PASSWORD_HASHER_OPTIONS={"pbkdf2": {"iterations": 2000}}):
+            assert password_hashing_executor.check_password("password", encoded) == (True, True)
+
+        metrics = password_hashing_executor.metrics()
+        assert metrics["submitted"] == submitted + 4
+        assert metrics["queue_depth"] == 0
+        assert metrics["max_queue_depth"] >= 1
+
+
+class ImportUsersCommandTestCase(APITestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_file(self, name: str, rows: list[dict]) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", newline="") as f:
+            if name.endswith(".csv"):
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+            else:
+                f.writelines(json.dumps(row) + "\n" for row in rows)
+        return path
+
+    def make_rows(self, count: int, start: int = 0) -> list[dict]:
+        return [
+            {
+                "email": f"import{i}@example.com",
+                "username": f"import{i}",
+                "nickname": f"import{i}",
+                "phone_number": generate_phone_number_string(),
+                "password": f"password{i}"
+            }
+            for i in range(start, start + count)
+        ]
+
+    def call(self, path: str, *args) -> str:
+        out = io.StringIO()
+        call_command("import_users", path, "--processes", "0", *args, stdout=out, stderr=io.StringIO())
+        return out.getvalue()
+
+    def test_import_csv(self):
+        path = self.write_file("users.csv", self.make_rows(5))
+
+        # 성공: 인증번호 확인 signal 없이 chunk 단위로 적재
+        output = self.call(path, "--chunk-size", "2")
+        assert User.objects.filter(email__startswith="import").count() == 5
+        assert "5 rows, 5 inserted" in output
+        assert "rows/s" in output
+        user = User.objects.get(email="import3@example.com")
+        assert user.check_password("password3")
+        assert user.is_active and not user.is_staff
+
+        # 성공: 이미 적재된 email은 건너뜀
+        output = self.call(path, "--restart")
+        assert "0 inserted, 0 invalid, 5 duplicated" in output
+        assert User.objects.filter(email__startswith="import").count() == 5
+
+    def test_import_jsonl_prehashed(self):
+        rows = self.make_rows(3)
+        for row in rows:
+            row["password"] = make_password(row["password"])
+        rows.append({**self.make_rows(1, start=3)[0], "password": "not_a_hash"})
+        rows.append({"email": "import5@example.com", "username": "import5"})
+        path = self.write_file("users.jsonl", rows)
+
+        # 성공: 해시된 비밀번호는 그대로 적재하고 잘못된 행은 제외
+        output = self.call(path, "--prehashed")
+        assert "5 rows, 3 inserted, 2 invalid" in output
+        assert User.objects.get(email="import1@example.com").check_password("password1")
+        assert not User.objects.filter(email__in=["import3@example.com", "import5@example.com"]).exists()
+
+    def test_import_invalid_rows(self):
+        rows = self.make_rows(6)
+        rows[1]["phone_number"] = "010-0000-0000-0000-0000"
+        rows[2]["email"] = "not_an_email"
+        rows[3]["username"] = "u" * 151
+        rows[4]["otp_register_code"] = "1234567"
+        path = self.write_file("users.jsonl", rows)
+        with open(path, "a") as f:
+            f.write("{not json\n")
+            f.write("[1, 2]\n")
+
+        # 성공: 길이 / 형식이 잘못된 행, 잘못된 JSON 행은 invalid로 집계하고 나머지는 적재
+        err = io.StringIO()
+        call_command("import_users", path, "--processes", "0", stdout=io.StringIO(), stderr=err)
+        assert set(User.objects.filter(email__startswith="import").values_list("username", flat=True)) == {
+            "import0", "import5"
+        }
+        errors = err.getvalue()
+        for error in ("invalid_phone_number", "invalid_email", "invalid_username", "invalid_otp_register_code",
+                      "invalid_json", "invalid_row"):
+            assert error in errors
+        with open(path + ".checkpoint") as f:
+            assert json.load(f) == {"rows": 8}
+
+    def test_resume_from_checkpoint(self):
+        path = self.write_file("users.csv", self.make_rows(4))
+        with open(path + ".checkpoint", "w") as f:
+            json.dump({"rows": 2}, f)
+
+        # 성공: checkpoint 이후의 행부터 적재
+        output = self.call(path)
+        assert "resuming after 2 rows" in output
+        assert set(User.objects.filter(email__startswith="import").values_list("username", flat=True)) == {
+            "import2", "import3"
+        }
+        with open(path + ".checkpoint") as f:
+            assert json.load(f) == {"rows": 4}
+
+
+class ExportUsersTestCase(APITestCase):
+    def setUp(self) -> None:
+        caches[app_settings.THROTTLE_CACHE].clear()
+        self.client = APIClient()
+        self.users = User.objects.bulk_create([
+            User(
+                email=f"export{i}@example.com",
+                username=f"export{i}",
+                nickname=f"export{i}",
+                phone_number=generate_phone_number_string(),
+                is_staff=i == 0,
+                password=make_password("password")
+            )
+            for i in range(3)
+        ])
+
+    def authenticate(self, user: User) -> None:
+        token = RefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    @override_settings(USER_EXPORT_CHUNK_SIZE=2)
+    def test_export_command(self):
+        # 성공: NDJSON은 한 줄에 사용자 하나
+        out = io.StringIO()
+        call_command("export_users", stdout=out, stderr=io.StringIO())
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert [row["email"] for row in rows] == [user.email for user in self.users]
+        assert set(rows[0]) == set(UserSerializer.Meta.fields)
+        assert rows[0]["is_staff"] is True
+
+        # 성공: CSV는 header 이후 사용자 하나씩
+        out = io.StringIO()
+        call_command("export_users", "--format", "csv", stdout=out, stderr=io.StringIO())
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        assert [row["username"] for row in rows] == [user.username for user in self.users]
+
+    def test_export_endpoint(self):
+        url = "http://127.0.0.1:8000/user/export/"
+
+        # 실패: 인증 정보 없이 요청
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        # 실패: staff가 아닌 사용자
+        self.authenticate(self.users[1])
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        # 성공: staff 사용자는 스트리밍 응답으로 내려받음
+        self.authenticate(self.users[0])
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [user.id for user in self.users]
+
+        # 성공: chunk 경계와 무관하게 모든 사용자를 pk 순서로 한 번씩
+        with override_settings(USER_EXPORT_CHUNK_SIZE=1):
+            response = self.client.get(url)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [user.id for user in self.users]
+
+        response = self.client.get(url, {"output": "csv"})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(b"".join(response.streaming_content).decode().splitlines()) == 4
+
+        # 실패: 지원하지 않는 형식
+        response = self.client.get(url, {"output": "xml"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # 실패: 다른 worker에서 staff 권한 회수 (snapshot이 남아 있어도 DB 기준으로 확인)
+        User.objects.filter(pk=self.users[0].pk).update(is_staff=False)
+        response = self.client.get(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class BulkFactoryTestCase(APITestCase):
+    def test_create_bulk(self):
+        # 성공: chunk 단위로 bulk_create, 사용자마다 query를 실행하지 않음
+        with CaptureQueriesContext(connection) as context:
+            counts = list(UserFactory.create_bulk(25, chunk_size=10))
+        assert counts == [10, 10, 5]
+        assert len(context.captured_queries) <= 3 * 3
+
+        # 성공: 전화번호 / email 중복 없음, 비밀번호 hash는 하나
+        assert User.objects.values("phone_number").distinct().count() == 25
+        assert User.objects.values("email").distinct().count() == 25
+        assert User.objects.values("password").distinct().count() == 1
+        assert User.objects.get(username="user7").check_password(BULK_PASSWORD)
+
+        # 성공: 이어서 생성하는 경우 start로 번호 구간 지정
+        list(UserFactory.create_bulk(5, start=25))
+        assert User.objects.values("phone_number").distinct().count() == 30
+
+        auth_otps = AuthOtpFactory.create_bulk_batch(3)
+        assert [auth_otp.number for auth_otp in auth_otps] == [sequence_phone_number(i) for i in range(3)]
+        assert AuthOtp.objects.filter(otp_key="").count() == 0
@@ -0,0 +1,162 @@
+import time
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import APIException, MethodNotAllowed, ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from users.models import AuthOtp
+from users.otp_backends import get_otp_backend
+from utils.exceptions import custom_exception_handler
+from utils.metrics import current_metrics
+from utils.renderers import ResponseRenderer
+from .authentication import CachedJWTAuthentication
+from .exceptions import Throttled, NotAuthenticated
+from .serializers import (
+    AuthOtpSendSMSSerializer,
+    AuthOtpVerifyCodeSerializer,
+    LoginSerializer,
+    SignupSerializer,
+    UserSerializer
+)
+from project.conf import app_settings
+
+
+class AsyncBaseView(View):
+    """
+    ASGI-native counterpart of BaseViewSet: parses, throttles, authenticates and renders
+    (ResponseRenderer / custom_exception_handler) without leaving the event loop.
+    """
+    http_method_names = ["get", "post", "put"]
+    throttle_scope = None
+    authentication_classes = []
+    authentication_required_methods = []
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+        try:
+            handler = getattr(self, request.method.lower(), None)
+            if request.method.lower() not in self.http_method_names or handler is None:
+                raise MethodNotAllowed(request.method)
+            await self.perform_authentication(request)
+            await self.check_throttles(request)
+            status_code, data = await handler(request, *args, **kwargs)
+        except (APIException, DjangoValidationError) as exc:
+            return self.handle_exception(request, exc)
+        return self.render(status_code, data)
+
+    async def perform_authentication(self, request) -> None:
+        for authentication_class in self.authentication_classes:
+            user_auth_tuple = await authentication_class().aauthenticate(request)
+            if user_auth_tuple is not None:
+                request.user, request.auth = user_auth_tuple
+                return
+        if request.method.lower() in self.authentication_required_methods:
+            raise NotAuthenticated()
+
+    def get_throttles(self, request) -> list:
+        if self.throttle_scope and request.user.is_anonymous:
+            return [app_settings.REST_FRAMEWORK_SCOPED_THROTTLE_CLASS()]
+        return [throttle() for throttle in app_settings.REST_FRAMEWORK_THROTTLE_CLASSES]
+
+    async def check_throttles(self, request) -> None:
+        metrics, started_at = current_metrics.get(), time.perf_counter()
+        try:
+            await self._check_throttles(request)
+        finally:
+            if metrics is not None:
+                metrics.throttle += time.perf_counter() - started_at
+
+    async def _check_throttles(self, request) -> None:
+        durations = []
+        for throttle in self.get_throttles(request):
+            if hasattr(throttle, "aallow_request"):
+                allowed = await throttle.aallow_request(request, self)
+            else:
+                allowed = await sync_to_async(throttle.allow_request, thread_sensitive=False)(request, self)
+            if not allowed:
+                durations.append(throttle.wait())
+        if durations:
+            durations = [duration for duration in durations if duration is not None]
+            raise Throttled(max(durations, default=None))
+
+    def handle_exception(self, request, exc: APIException) -> HttpResponse:
+        if isinstance(exc, NotAuthenticated) and self.authentication_classes:
+            exc.auth_header = self.authentication_classes[0]().authenticate_header(request)
+        response = custom_exception_handler(exc, {"view": self, "request": request})
+        headers = {key: response[key] for key in ("WWW-Authenticate", "Retry-After") if response.has_header(key)}
+        return self.render(response.status_code, response.data, headers=headers)
+
+    def render(self, status_code: int, data, headers=None) -> HttpResponse:
+        renderer = ResponseRenderer()
+        content = renderer.render(data, renderer_context={"response": SimpleNamespace(status_code=status_code)})
+        response = HttpResponse(content, status=status_code, content_type=f"{renderer.media_type}; charset=utf-8")
+        for key, value in (headers or {}).items():
+            response[key] = value
+        return response
+
+
+class AsyncSendCodeView(AsyncBaseView):
+    throttle_scope = "user.send_code"
+
+    async def post(self, request):
+        serializer = AuthOtpSendSMSSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        await serializer.asave()
+        return status.HTTP_201_CREATED, serializer.data
+
+
+class AsyncVerifyCodeView(AsyncBaseView):
+    throttle_scope = "user.verify_code"
+
+    async def post(self, request):
+        try:
+            instance = await get_otp_backend().alatest(request.data["number"])
+        except (KeyError, AuthOtp.DoesNotExist):
+            raise ValidationError("invalid_number")
+        serializer = AuthOtpVerifyCodeSerializer(instance=instance, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        await serializer.asave()
+        return status.HTTP_200_OK, serializer.data
+
+    put = post
+
+
+class AsyncSignupView(AsyncBaseView):
+    async def post(self, request):
+        # 가입은 여러 쿼리를 하나의 transaction으로 묶어야 하므로 한 번의 thread 전환으로 처리
+        serializer = SignupSerializer(data=request.data)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await sync_to_async(serializer.save)()
+        return status.HTTP_201_CREATED, serializer.data
+
+
+class AsyncLoginView(AsyncBaseView):
+    async def post(self, request):
+        serializer = LoginSerializer(data=request.data, partial=True)
+        attrs = serializer.to_internal_value(request.data)
+        return status.HTTP_201_CREATED, await serializer.avalidate(attrs)
+
+
+class AsyncUserDetailView(AsyncBaseView):
+    authentication_classes = [CachedJWTAuthentication]
+    authentication_required_methods = ["get", "put"]
+
+    async def get(self, request):
+        return status.HTTP_200_OK, {"user": UserSerializer(request.user).data}
+
+    async def put(self, request):
+        serializer = UserSerializer(instance=request.user, data=request.data, partial=True)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await sync_to_async(serializer.save)()
+        return status.HTTP_200_OK, serializer.data
@@ -0,0 +1,149 @@
+import copy
+import time
+import threading
+from collections import OrderedDict, defaultdict
+
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS, BasePermission
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from project.conf import app_settings
+
+
+class UserSnapshotCache:
+    # 사용자별 version은 모든 worker가 공유하는 cache에 저장, 다른 worker의 변경(비활성화 / 권한 변경)도 snapshot 조회 시 반영
+    version_key_prefix = "user_snapshot_version"
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._keys = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def version_key(self, user_id) -> str:
+        return f"{self.version_key_prefix}:{user_id}"
+
+    def version(self, user_id):
+        # DB에서 사용자를 조회하기 전에 읽어서 set()에 전달 (조회 중의 변경도 다음 조회에서 반영)
+        return caches[app_settings.USER_SNAPSHOT_CACHE].get(self.version_key(user_id))
+
+    async def aversion(self, user_id):
+        return await caches[app_settings.USER_SNAPSHOT_CACHE].aget(self.version_key(user_id))
+
+    def get(self, key: tuple, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expired_at, entry_version, user = entry
+            if expired_at <= time.monotonic() or entry_version != version:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+        return copy.copy(user)
+
+    def set(self, key: tuple, user, version) -> None:
+        expired_at = time.monotonic() + app_settings.USER_SNAPSHOT_TTL
+        with self._lock:
+            self._entries[key] = (expired_at, version, copy.copy(user))
+            self._entries.move_to_end(key)
+            self._keys[key[0]].add(key)
+            while len(self._entries) > app_settings.USER_SNAPSHOT_MAX_SIZE:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, user_id) -> None:
+        # version이 만료되기 전에 그 이전의 snapshot이 모두 만료되도록 TTL 동안 유지
+        caches[app_settings.USER_SNAPSHOT_CACHE].set(
+            self.version_key(user_id), time.time_ns(), timeout=max(app_settings.USER_SNAPSHOT_TTL, 1)
+        )
+        with self._lock:
+            for key in list(self._keys.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+
+    def _remove(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[key[0]]
+
+
+user_snapshot_cache = UserSnapshotCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    # snapshot은 조회(GET / HEAD / OPTIONS)에만 사용, 변경 요청은 DB에서 최신 사용자를 조회
+    use_snapshot = True
+
+    def authenticate(self, request):
+        self.use_snapshot = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        if not app_settings.USER_SNAPSHOT_TTL or not self.use_snapshot:
+            return super().get_user(validated_token)
+
+        key = (validated_token.get(api_settings.USER_ID_CLAIM), validated_token.get("iat"))
+        version = user_snapshot_cache.version(key[0])
+        user = user_snapshot_cache.get(key, version)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_snapshot_cache.set(key, user, version)
+        return user
+
+    async def aauthenticate(self, request):
+        self.use_snapshot = request.method in SAFE_METHODS
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        use_snapshot = app_settings.USER_SNAPSHOT_TTL and self.use_snapshot
+        key = (validated_token.get(api_settings.USER_ID_CLAIM), validated_token.get("iat"))
+        version = await user_snapshot_cache.aversion(key[0]) if use_snapshot else None
+        user = user_snapshot_cache.get(key, version) if use_snapshot else None
+        if user is not None:
+            return user
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if use_snapshot:
+            user_snapshot_cache.set(key, user, version)
+        return user
+
+
+class IsAdminUserFromDatabase(BasePermission):
+    # snapshot의 is_staff가 아닌 DB의 현재 권한으로 확인 (권한 회수 즉시 반영)
+    def has_permission(self, request, view):
+        user = request.user
+        if not (user and user.is_authenticated):
+            return False
+        return type(user).objects.filter(pk=user.pk, is_staff=True, is_active=True).exists()
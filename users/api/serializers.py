@@ -1,9 +1,8 @@
 import re
 import datetime
 
-from django.contrib.auth.hashers import check_password
-from django.db import transaction
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -11,6 +10,11 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from project.conf import app_settings
 from users.fields import ChoiceTypeField
 from users.models import AuthOtp, User
+from users.recorders import last_login_recorder
+from users.notifications import sms_dispatcher
+from users.otp_backends import get_otp_backend
+from users.hashers import password_hashing_executor
+from .authentication import user_snapshot_cache
 from users.choices import AuthOtpTypeEnum, LoginTypeEnum
 
 
@@ -39,22 +43,34 @@ class AuthOtpSendSMSSerializer(serializers.ModelSerializer):
         return regex.string
 
     def save(self, **kwargs):
-        try:
-            auth_otp = self.Meta.model.objects.filter(**self.validated_data, authenticated=False).latest()
-        except self.Meta.model.DoesNotExist:
-            auth_otp = self.Meta.model.objects.create(**self.validated_data)
+        auth_otp = get_otp_backend().issue(**self.validated_data)
+        self.instance = auth_otp
+        self.dispatch(auth_otp)
+        return auth_otp
 
+    async def asave(self, **kwargs):
+        auth_otp = await get_otp_backend().aissue(**self.validated_data)
         self.instance = auth_otp
+        self.dispatch(auth_otp)
         return auth_otp
 
+    def dispatch(self, auth_otp: AuthOtp) -> None:
+        # 발송은 queue에 넣기만 하고, 응답에는 발송한 것과 같은 인증번호를 사용
+        self.otp_code_with_expiry = auth_otp.otp_code_with_expiry()
+        otp_code, expired_dt = self.otp_code_with_expiry
+        body = app_settings.SMS_MESSAGE_TEMPLATE.format(
+            otp_code=otp_code,
+            expired_at=expired_dt.strftime('%Y-%m-%d %H:%M:%S')
+        )
+        sms_dispatcher.send(auth_otp.number, body)
+
     def to_representation(self, instance: AuthOtp):
-        expired_dt = self.instance.timestamp + datetime.timedelta(0, self.instance.otp_interval)
+        otp_code, expired_dt = getattr(self, 'otp_code_with_expiry', None) or self.instance.otp_code_with_expiry()
         data = super().to_representation(self.instance)
         data.pop('auth_type')
-        data.update({
-            'otp_code': self.instance.otp_code,
-            'expired_at': expired_dt.strftime('%Y-%m-%d %H:%M:%S')
-        })
+        data['expired_at'] = expired_dt.strftime('%Y-%m-%d %H:%M:%S')
+        if app_settings.OTP_CODE_IN_RESPONSE:
+            data['otp_code'] = otp_code
         return data
 
 
@@ -74,8 +90,10 @@ class AuthOtpVerifyCodeSerializer(serializers.ModelSerializer):
         fields = ["number", "otp_code", "verified_at", "auth_type", "otp_register_code"]
 
     def validate_number(self, value):
+        if self.instance is not None and self.instance.number == value:
+            return value
         try:
-            instance = self.Meta.model.objects.filter(number=value).latest()
+            instance = get_otp_backend().latest(value)
             self.instance = instance
         except self.Meta.model.DoesNotExist:
             raise ValidationError("invalid_number")
@@ -91,16 +109,19 @@ class AuthOtpVerifyCodeSerializer(serializers.ModelSerializer):
         return auth_type
 
     def save(self, **kwargs):
-        otp_code = self.validated_data.pop("otp_code")
-        verified = self.instance.authenticate_code_by_otp_key(otp_code)
-        if not verified:
+        if self.instance is None:
+            raise ValidationError("invalid_number")
+        if not get_otp_backend().verify(self.instance, self.validated_data["otp_code"]):
             raise ValidationError("invalid_code")
-        self.validated_data.update({"otp_register_code": otp_code})
-        if self.instance is not None:
-            self.instance = self.update(self.instance, self.validated_data)
-            self.verified_at = datetime.datetime.now()
-        else:
+        self.verified_at = datetime.datetime.now()
+        return self.instance
+
+    async def asave(self, **kwargs):
+        if self.instance is None:
             raise ValidationError("invalid_number")
+        if not await get_otp_backend().averify(self.instance, self.validated_data["otp_code"]):
+            raise ValidationError("invalid_code")
+        self.verified_at = datetime.datetime.now()
         return self.instance
 
     def to_representation(self, instance):
@@ -127,25 +148,30 @@ class SignupSerializer(serializers.ModelSerializer):
             "otp_register_code",
             "auth_otp"
         ]
-
-    def validate(self, attrs):
-        number = attrs["phone_number"]
-        try:
-            auth_otp = AuthOtp.objects.filter(number=number, authenticated=False).latest()
-            assert str(auth_otp.otp_register_code) == str(attrs["otp_register_code"])
-            self.auth_otp = auth_otp
-        except AuthOtp.DoesNotExist:
-            raise ValidationError("invalid_number")
-        except AssertionError:
-            raise ValidationError("unauthenticated_otp")
-        return attrs
+        # email 중복은 SELECT 대신 INSERT 시 unique 제약으로 확인
+        extra_kwargs = {"email": {"validators": []}}
 
     def save(self, **kwargs):
-        with transaction.atomic():
-            user = self.Meta.model.objects.create_authenticated_user_from_request(**self.validated_data)
-            self.auth_otp.authenticated = True
-            self.auth_otp.save()
-            return user
+        # 인증정보 행을 한 번 잠그고 조회 → 사용자 INSERT → 인증 완료 UPDATE
+        number, backend = self.validated_data["phone_number"], get_otp_backend()
+        try:
+            with transaction.atomic():
+                try:
+                    auth_otp = backend.latest(number, authenticated=False, for_update=True)
+                except AuthOtp.DoesNotExist:
+                    raise ValidationError("invalid_number")
+                if str(auth_otp.otp_register_code) != str(self.validated_data["otp_register_code"]):
+                    raise ValidationError("unauthenticated_otp")
+
+                user = self.Meta.model.objects.create_authenticated_user_from_request(
+                    auth_otp=auth_otp,
+                    **self.validated_data
+                )
+                if not backend.mark_authenticated(auth_otp):
+                    raise ValidationError("invalid_number")
+                return user
+        except IntegrityError:
+            raise ValidationError("duplicated_email")
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
@@ -167,6 +193,13 @@ class UserSerializer(serializers.ModelSerializer):
             "last_login_datetime"
         ]
 
+    def update(self, instance, validated_data):
+        # 요청에 포함된 필드만 저장 (다른 worker의 비밀번호 / 권한 변경을 덮어쓰지 않음)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
+
 
 class LoginSerializer(TokenObtainPairSerializer):
     email = serializers.EmailField(max_length=255)
@@ -181,27 +214,45 @@ class LoginSerializer(TokenObtainPairSerializer):
         valid_choice={"login_type": LoginTypeEnum.choices_list()}
     )
 
-    def validate(self, attrs):
+    def get_login_type(self, attrs) -> str:
         default_login_type = self.get_fields().get('login_type').default
-        login_type = attrs.get("login_type", default_login_type)
-        filter_kwargs = {login_type: attrs[login_type]}
-        try:
-            user = User.objects.get(Q(**filter_kwargs))
-            if not user.check_password(attrs["password"]):
-                raise ValidationError("wrong_password")
-        except User.DoesNotExist:
-            raise ValidationError("no_exist_user")
+        return attrs.get("login_type", default_login_type)
 
+    def get_login_data(self, user: User) -> dict:
         refresh = self.get_token(user)
-        data = {
+        return {
             "user": UserSerializer(user).data,
             "access": str(refresh.access_token),
             "refresh": str(refresh)
         }
+
+    def validate(self, attrs):
+        login_type = self.get_login_type(attrs)
+        try:
+            user = User.objects.get_by_login_type(login_type, attrs[login_type])
+            if not user.check_password(attrs["password"]):
+                raise ValidationError("wrong_password")
+        except User.DoesNotExist:
+            raise ValidationError("no_exist_user")
+
+        data = self.get_login_data(user)
         if app_settings.SIMPLE_JWT_UPDATE_LOGIN_SETTING:
-            user.last_login_datetime = timezone.now()
-            user.last_login_type = default_login_type
-            user.save(update_fields=["last_login_datetime", "last_login_type"])
+            last_login_recorder.record(user, login_type, timezone.now())
+
+        return data
+
+    async def avalidate(self, attrs):
+        login_type = self.get_login_type(attrs)
+        try:
+            user = await User.objects.aget_by_login_type(login_type, attrs[login_type])
+            if not await user.acheck_password(attrs["password"]):
+                raise ValidationError("wrong_password")
+        except User.DoesNotExist:
+            raise ValidationError("no_exist_user")
+
+        data = self.get_login_data(user)
+        if app_settings.SIMPLE_JWT_UPDATE_LOGIN_SETTING:
+            await sync_to_async(last_login_recorder.record)(user, login_type, timezone.now())
 
         return data
 
@@ -226,11 +277,11 @@ class PasswordSerializer(serializers.Serializer):
     def validate(self, attrs):
         number = attrs["number"]
         try:
-            auth_otp = AuthOtp.objects.filter(
-                number=number,
-                authenticated=False,
-                auth_type=AuthOtpTypeEnum.PASSWORD_RESET.value
-            ).latest()
+            auth_otp = get_otp_backend().latest(
+                number,
+                auth_type=AuthOtpTypeEnum.PASSWORD_RESET.value,
+                authenticated=False
+            )
         except AuthOtp.DoesNotExist:
             raise ValidationError("invalid_number_or_code")
         try:
@@ -245,17 +296,18 @@ class PasswordSerializer(serializers.Serializer):
         except User.DoesNotExist:
             raise ValidationError("no_exist_user")
 
-        if check_password(attrs["new_passwd"], self.user.password):
+        if password_hashing_executor.check_password(attrs["new_passwd"], self.user.password)[0]:
             raise ValidationError("previous_passwd")
 
-        auth_otp.authenticated = True
-        auth_otp.save()
+        if not get_otp_backend().mark_authenticated(auth_otp):
+            raise ValidationError("invalid_number_or_code")
 
         return attrs
 
     def save(self, **kwargs):
         self.user.set_password(self.validated_data["new_passwd"])
         self.user.save()
+        user_snapshot_cache.invalidate(self.user.pk)
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
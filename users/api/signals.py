@@ -1,11 +1,13 @@
 import re
 import pyotp
 from django.dispatch import receiver
-from django.db.models.signals import pre_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.core.exceptions import ValidationError
 
 from users.choices import AuthOtpTypeEnum
 from users.models import User, AuthOtp
+from users.otp_backends import get_otp_backend
+from .authentication import user_snapshot_cache
 
 
 @receiver(pre_save, sender=AuthOtp)
@@ -16,12 +18,24 @@ def generate_otp_key(sender, instance: AuthOtp, **kwargs):
 
 
 @receiver(pre_save, sender=User)
-def authenticate_user_phone(sender, instance: User, **kwargs):
-    try:
-        auth_otp = AuthOtp.objects.filter(number=instance.phone_number).latest()
-    except AuthOtp.DoesNotExist:
-        raise ValidationError('invalid_number')
+def authenticate_user_phone(sender, instance: User, update_fields=None, **kwargs):
+    if update_fields is not None and "phone_number" not in update_fields:
+        return
+    if not instance.phone_number_changed:
+        return
+    auth_otp = getattr(instance, "verified_auth_otp", None)
+    if auth_otp is None or auth_otp.number != instance.phone_number:
+        try:
+            auth_otp = get_otp_backend().latest(instance.phone_number)
+        except AuthOtp.DoesNotExist:
+            raise ValidationError('invalid_number')
     if not auth_otp.otp_register_code:
         raise ValidationError('unauthenticated_otp_code')
     if auth_otp.auth_type == AuthOtpTypeEnum.EMAIL.value and auth_otp.otp_register_code != instance.otp_register_code:
         raise ValidationError('invalid_otp_code')
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_snapshot(sender, instance: User, **kwargs):
+    user_snapshot_cache.invalidate(instance.pk)
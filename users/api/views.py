@@ -1,11 +1,16 @@
 import json
 
-from rest_framework import viewsets, status, permissions, throttling
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from rest_framework_simplejwt import authentication
 from users.models import AuthOtp, User
 from users.choices import AuthOtpTypeEnum
+from users.exports import EXPORT_CONTENT_TYPES, export_users
+from users.otp_backends import get_otp_backend
+from .authentication import CachedJWTAuthentication, IsAdminUserFromDatabase
 from .exceptions import Throttled, NotAuthenticated, PermissionDenied
 from .serializers import (
     AuthOtpSendSMSSerializer,
@@ -16,9 +21,10 @@ from .serializers import (
     PasswordSerializer
 )
 from project.conf import app_settings
+from utils.metrics import MetricsViewMixin
 
 
-class BaseViewSet(viewsets.ModelViewSet):
+class BaseViewSet(MetricsViewMixin, viewsets.ModelViewSet):
     lookup_data_key = None
 
     def throttled(self, request, wait):
@@ -30,16 +36,17 @@ class BaseViewSet(viewsets.ModelViewSet):
         raise PermissionDenied
 
     def get_object_by_data(self):
-        queryset = self.get_queryset()
         if self.lookup_data_key not in self.request.data:
-            return queryset.none()
+            return None
         filter_kwargs = {self.lookup_data_key: self.request.data[self.lookup_data_key]}
-        filtered_queryset = queryset.filter(**filter_kwargs)
-        return filtered_queryset.latest() if filtered_queryset else filtered_queryset
+        try:
+            return self.get_queryset().filter(**filter_kwargs).latest()
+        except ObjectDoesNotExist:
+            return None
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
-        instance = kwargs.pop('instance', self.get_object_by_data())
+        instance = kwargs.pop('instance') if 'instance' in kwargs else self.get_object_by_data()
         serializer = self.get_serializer(
             instance=instance,
             data=self.request.data,
@@ -50,7 +57,17 @@ class BaseViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class AuthViewSet(BaseViewSet):
+class OtpLookupMixin:
+    def get_object_by_data(self):
+        if self.lookup_data_key not in self.request.data:
+            return None
+        try:
+            return get_otp_backend().latest(self.request.data[self.lookup_data_key])
+        except AuthOtp.DoesNotExist:
+            return None
+
+
+class AuthViewSet(OtpLookupMixin, BaseViewSet):
     lookup_data_key = 'number'
     queryset = AuthOtp.objects.all()
     serializer_class = AuthOtpSendSMSSerializer
@@ -59,7 +76,7 @@ class AuthViewSet(BaseViewSet):
     def set_throttles(self):
         if self.request.user.is_anonymous:
             self.throttle_scope = 'user.' + self.action
-            throttle_classes = [throttling.ScopedRateThrottle]
+            throttle_classes = [app_settings.REST_FRAMEWORK_SCOPED_THROTTLE_CLASS]
         else:
             throttle_classes = app_settings.REST_FRAMEWORK_THROTTLE_CLASSES
         self.throttle_classes = [throttle() for throttle in throttle_classes]
@@ -91,7 +108,9 @@ class UserViewSet(BaseViewSet):
     serializer_class = UserSerializer
 
     def set_permissions(self):
-        if self.request.method == 'GET':
+        if self.action == 'export':
+            permission_classes = [IsAdminUserFromDatabase]
+        elif self.request.method == 'GET':
             permission_classes = [permissions.IsAuthenticated]
         else:
             permission_classes = [permissions.AllowAny]
@@ -123,7 +142,7 @@ class UserViewSet(BaseViewSet):
     @action(
         detail=False,
         methods=["get", "put"],
-        authentication_classes=[authentication.JWTAuthentication],
+        authentication_classes=[CachedJWTAuthentication],
         url_path=r"detail"
     )
     def user_detail(self, request):
@@ -132,8 +151,22 @@ class UserViewSet(BaseViewSet):
             return Response({"user": UserSerializer(user).data}, status=status.HTTP_200_OK)
         return self.update(request, instance=self.request.user, partial=True)
 
+    @action(
+        detail=False,
+        methods=["get"],
+        authentication_classes=[CachedJWTAuthentication],
+        url_path=r"export"
+    )
+    def export(self, request):
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_CONTENT_TYPES:
+            raise ValidationError("invalid_output")
+        response = StreamingHttpResponse(export_users(output), content_type=EXPORT_CONTENT_TYPES[output])
+        response["Content-Disposition"] = f'attachment; filename="users.{output}"'
+        return response
+
 
-class PassWordViewSet(BaseViewSet):
+class PassWordViewSet(OtpLookupMixin, BaseViewSet):
     lookup_data_key = 'number'
     queryset = AuthOtp.objects.all()
     serializer_class = PasswordSerializer
@@ -0,0 +1,62 @@
+import csv
+from typing import Iterator
+
+from users.models import User
+from utils.renderers import get_json_backend
+from utils.routers import read_replica
+from project.conf import app_settings
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def iter_users(fields: dict, queryset=None, chunk_size: int = None) -> Iterator[dict]:
+    # pk 기준 keyset pagination으로 chunk 단위 조회 (서버 측 cursor 없이도, 예: pgbouncer, 일정한 메모리 사용)
+    # 모델 인스턴스 없이 serializer field 표현만 생성
+    queryset = User.objects.all() if queryset is None else queryset
+    with read_replica():
+        queryset = queryset.using(queryset.db)
+    queryset = queryset.order_by("pk").values_list("pk", *fields)
+    chunk_size = chunk_size or app_settings.USER_EXPORT_CHUNK_SIZE
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(chunk[:chunk_size])
+        for _, *values in rows:
+            yield {
+                name: None if value is None else field.to_representation(value)
+                for (name, field), value in zip(fields.items(), values)
+            }
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][0]
+
+
+def iter_ndjson(rows: Iterator[dict]) -> Iterator[bytes]:
+    dumps = get_json_backend(app_settings.RESPONSE_JSON_BACKEND)
+    for row in rows:
+        yield dumps(row) + b"\n"
+
+
+def iter_csv(rows: Iterator[dict], fieldnames: list[str]) -> Iterator[bytes]:
+    writer = csv.writer(Echo())
+    yield writer.writerow(fieldnames).encode("utf-8")
+    for row in rows:
+        yield writer.writerow(row.values()).encode("utf-8")
+
+
+def export_users(output: str, queryset=None, chunk_size: int = None) -> Iterator[bytes]:
+    from users.api.serializers import UserSerializer
+
+    fields = dict(UserSerializer().fields)
+    rows = iter_users(fields, queryset, chunk_size)
+    if output == "csv":
+        return iter_csv(rows, list(fields))
+    return iter_ndjson(rows)
@@ -0,0 +1,175 @@
+import atexit
+import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.contrib.auth import hashers
+from django.core.signals import setting_changed
+from django.db import DatabaseError, close_old_connections
+from django.dispatch import receiver
+from project.conf import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["pbkdf2"]["iterations"]
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    @property
+    def work_factor(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["scrypt"]["work_factor"]
+
+    @property
+    def block_size(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["scrypt"]["block_size"]
+
+    @property
+    def parallelism(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["scrypt"]["parallelism"]
+
+    @property
+    def maxmem(self) -> int:
+        return 256 * self.work_factor * self.block_size * self.parallelism
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["argon2"]["time_cost"]
+
+    @property
+    def memory_cost(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["argon2"]["memory_cost"]
+
+    @property
+    def parallelism(self) -> int:
+        return app_settings.PASSWORD_HASHER_OPTIONS["argon2"]["parallelism"]
+
+
+class PasswordRehasher:
+    def __init__(self):
+        self._executor = None
+
+    def submit(self, user_id, encoded: str, raw_password: str) -> None:
+        if not app_settings.PASSWORD_REHASH_IN_BACKGROUND:
+            self.rehash(user_id, encoded, raw_password)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="password-rehasher")
+        self._executor.submit(self._rehash_in_background, user_id, encoded, raw_password)
+
+    def rehash(self, user_id, encoded: str, raw_password: str) -> bool:
+        from users.models import User
+        # 해시 갱신 사이에 비밀번호가 변경된 경우 덮어쓰지 않음
+        updated = User.objects.filter(pk=user_id, password=encoded).update(
+            password=hashers.make_password(raw_password)
+        )
+        if updated:
+            # QuerySet.update는 post_save를 보내지 않음
+            from users.api.authentication import user_snapshot_cache
+            user_snapshot_cache.invalidate(user_id)
+        return bool(updated)
+
+    def _rehash_in_background(self, user_id, encoded: str, raw_password: str) -> None:
+        close_old_connections()
+        try:
+            self.rehash(user_id, encoded, raw_password)
+        except DatabaseError:
+            logger.exception("password_rehash_failed")
+        finally:
+            close_old_connections()
+
+
+def _init_hashing_worker() -> None:
+    import django
+    django.setup()
+
+
+def _make_password(raw_password: str) -> tuple[float, str]:
+    return time.time(), hashers.make_password(raw_password)
+
+
+def _check_password(raw_password: str, encoded: str) -> tuple[float, tuple[bool, bool]]:
+    started_at, must_update = time.time(), []
+    valid = hashers.check_password(raw_password, encoded, setter=lambda raw: must_update.append(True))
+    return started_at, (valid, bool(must_update))
+
+
+class PasswordHashingExecutor:
+    def __init__(self):
+        self._executor = None
+        self._slots = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    def make_password(self, raw_password: str) -> str:
+        return self._run(_make_password, raw_password)
+
+    def check_password(self, raw_password: str, encoded: str) -> tuple[bool, bool]:
+        return self._run(_check_password, raw_password, encoded)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor, self._slots = self._executor, None, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _run(self, func, *args):
+        if not app_settings.PASSWORD_HASHING_PROCESSES:
+            return func(*args)[1]
+
+        executor, slots = self._get_executor()
+        submitted_at = time.time()
+        self._track(queue_depth=1)
+        try:
+            with slots:
+                started_at, result = executor.submit(func, *args).result()
+        finally:
+            self._track(queue_depth=-1)
+        self._track(wait=max(0.0, started_at - submitted_at))
+        return result
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                processes = app_settings.PASSWORD_HASHING_PROCESSES
+                self._executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_hashing_worker)
+                self._slots = threading.BoundedSemaphore(app_settings.PASSWORD_HASHING_QUEUE_SIZE or processes)
+            return self._executor, self._slots
+
+    def _track(self, queue_depth: int = 0, wait: float = None) -> None:
+        with self._lock:
+            stats = self._stats
+            if queue_depth > 0:
+                stats["submitted"] += 1
+            stats["queue_depth"] += queue_depth
+            stats["max_queue_depth"] = max(stats["max_queue_depth"], stats["queue_depth"])
+            if wait is not None:
+                stats["wait_seconds_total"] += wait
+                stats["wait_seconds_max"] = max(stats["wait_seconds_max"], wait)
+
+
+password_rehasher = PasswordRehasher()
+password_hashing_executor = PasswordHashingExecutor()
+atexit.register(password_hashing_executor.shutdown)
+
+
+@receiver(setting_changed)
+def reset_password_hashing_executor(setting, **kwargs):
+    if setting.startswith("PASSWORD_HASH"):
+        password_hashing_executor.shutdown()
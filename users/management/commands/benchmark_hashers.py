@@ -0,0 +1,59 @@
+import math
+import os
+import time
+
+from django.core.management.base import BaseCommand
+from users.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher, Argon2PasswordHasher
+
+HASHERS = {
+    "pbkdf2": (PBKDF2PasswordHasher, "iterations"),
+    "scrypt": (ScryptPasswordHasher, "work_factor"),
+    "argon2": (Argon2PasswordHasher, "time_cost"),
+}
+
+
+class Command(BaseCommand):
+    help = "Report password hashes per second per core for each hasher tier"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tier", choices=list(HASHERS), action="append", dest="tiers")
+        parser.add_argument("--seconds", type=float, default=2.0)
+        parser.add_argument("--target-ms", type=float, default=None)
+
+    def handle(self, *args, **options):
+        cores = os.cpu_count() or 1
+        for tier in options["tiers"] or list(HASHERS):
+            hasher_class, param = HASHERS[tier]
+            hasher = hasher_class()
+            try:
+                count, elapsed = self.measure(hasher, options["seconds"])
+            except ValueError as e:
+                self.stdout.write(self.style.WARNING(f"{tier}: skipped ({e})"))
+                continue
+
+            per_core = count / elapsed
+            ms_per_hash = elapsed / count * 1000
+            value = getattr(hasher, param)
+            self.stdout.write(
+                f"{tier}: {per_core:.1f} hashes/s/core ({ms_per_hash:.1f} ms/hash), "
+                f"~{per_core * cores:.1f} hashes/s on {cores} cores, {param}={value}"
+            )
+            if options["target_ms"]:
+                suggested = self.calibrate(tier, value, ms_per_hash, options["target_ms"])
+                self.stdout.write(f"{tier}: {param}={suggested} for ~{options['target_ms']:.0f} ms/hash")
+
+    def measure(self, hasher, seconds: float) -> tuple[int, float]:
+        salt = hasher.salt()
+        count, start = 0, time.perf_counter()
+        while True:
+            hasher.encode("benchmark_password", salt)
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= seconds:
+                return count, elapsed
+
+    def calibrate(self, tier: str, value: int, ms_per_hash: float, target_ms: float) -> int:
+        scaled = value * target_ms / ms_per_hash
+        if tier == "scrypt":
+            return 2 ** max(1, round(math.log2(scaled)))
+        return max(1, round(scaled))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+from users.exports import EXPORT_CONTENT_TYPES, export_users
+
+
+class Command(BaseCommand):
+    help = "Stream every user as NDJSON / CSV (UserSerializer fields) with constant memory"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=list(EXPORT_CONTENT_TYPES), default="ndjson")
+        parser.add_argument("--output", default="-")
+        parser.add_argument("--chunk-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        started_at = time.perf_counter()
+        chunks = export_users(options["format"], chunk_size=options["chunk_size"])
+        if options["output"] == "-":
+            count = self.write(chunks, lambda chunk: self.stdout.write(chunk.decode("utf-8"), ending=""))
+        else:
+            with open(options["output"], "wb") as f:
+                count = self.write(chunks, f.write)
+
+        elapsed = time.perf_counter() - started_at
+        if options["format"] == "csv":
+            count -= 1
+        self.stderr.write(f"exported {count} users in {elapsed:.1f}s ({count / max(elapsed, 1e-9):.0f} rows/s)")
+
+    def write(self, chunks, write) -> int:
+        count = 0
+        for chunk in chunks:
+            write(chunk)
+            count += 1
+        return count
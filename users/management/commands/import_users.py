@@ -0,0 +1,191 @@
+import csv
+import io
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.contrib.auth.hashers import identify_hasher
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction, router
+from django.utils import timezone
+from users.hashers import _init_hashing_worker, _make_password
+from users.models import User
+from project.conf import app_settings
+
+
+class Command(BaseCommand):
+    help = "Stream users from a CSV / JSONL file into the user table in chunks (PostgreSQL COPY), bypassing model signals"
+
+    required_fields = ["email", "username", "nickname", "phone_number", "password"]
+    clean_fields = [*required_fields, "otp_register_code"]
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["csv", "jsonl"], default=None)
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--processes", type=int, default=None)
+        parser.add_argument("--prehashed", action="store_true")
+        parser.add_argument("--checkpoint", default=None)
+        parser.add_argument("--restart", action="store_true")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"no_such_file_{path}")
+        file_format = options["format"] or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        checkpoint = options["checkpoint"] or f"{path}.checkpoint"
+        done = 0 if options["restart"] else self.read_checkpoint(checkpoint)
+        if done:
+            self.stdout.write(f"resuming after {done} rows ({checkpoint})")
+
+        processes = options["processes"]
+        if processes is None:
+            processes = app_settings.PASSWORD_HASHING_PROCESSES or os.cpu_count() or 1
+        executor = None
+        if processes and not options["prehashed"]:
+            executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_hashing_worker)
+
+        db = router.db_for_write(User)
+        inserted = invalid = 0
+        started_at = time.perf_counter()
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = itertools.islice(self.read_rows(f, file_format), done, None)
+                while chunk := list(itertools.islice(rows, options["chunk_size"])):
+                    users, errors = self.build_users(chunk, done, options["prehashed"], executor)
+                    for line, error in errors:
+                        self.stderr.write(f"row {line}: {error}")
+                    with transaction.atomic(using=db):
+                        inserted += self.write(users, db)
+                    done += len(chunk)
+                    invalid += len(errors)
+                    self.write_checkpoint(checkpoint, done)
+                    elapsed = time.perf_counter() - started_at
+                    self.stdout.write(
+                        f"{done} rows, {inserted} inserted, {invalid} invalid, "
+                        f"{done - invalid - inserted} duplicated ({inserted / elapsed:.0f} rows/s)"
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.perf_counter() - started_at
+        self.stdout.write(self.style.SUCCESS(
+            f"imported {inserted} users in {elapsed:.1f}s ({inserted / max(elapsed, 1e-9):.0f} rows/s)"
+        ))
+
+    def read_rows(self, f, file_format: str):
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+            return
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # 잘못된 행은 clean_row에서 invalid로 집계
+                yield ValidationError("invalid_json")
+
+    def build_users(self, chunk: list[dict], offset: int, prehashed: bool, executor) -> tuple[list, list]:
+        rows, errors = [], []
+        for line, row in enumerate(chunk, start=offset + 1):
+            try:
+                rows.append(self.clean_row(row, prehashed))
+            except ValidationError as e:
+                errors.append((line, e.messages[0]))
+
+        passwords = [row["password"] for row in rows]
+        if not prehashed:
+            if executor is not None:
+                passwords = [encoded for _, encoded in executor.map(_make_password, passwords, chunksize=64)]
+            else:
+                passwords = [_make_password(password)[1] for password in passwords]
+
+        date_joined = timezone.now()
+        users = [
+            User(**{**row, "password": password, "date_joined": date_joined})
+            for row, password in zip(rows, passwords)
+        ]
+        return users, errors
+
+    def clean_row(self, row: dict, prehashed: bool) -> dict:
+        if isinstance(row, ValidationError):
+            raise row
+        if not isinstance(row, dict):
+            raise ValidationError("invalid_row")
+        for field_name in self.required_fields:
+            if not row.get(field_name):
+                raise ValidationError(f"{field_name}_field_required")
+        # 길이 / 형식 검사: 한 행의 DataError로 chunk 전체가 실패하지 않도록 적재 전에 제외
+        for field_name in self.clean_fields:
+            value = row.get(field_name)
+            if (field_name == "password" and not prehashed) or value in (None, ""):
+                continue
+            try:
+                User._meta.get_field(field_name).clean(value, None)
+            except ValidationError:
+                raise ValidationError(f"invalid_{field_name}")
+        if prehashed:
+            try:
+                identify_hasher(row["password"])
+            except ValueError:
+                raise ValidationError("invalid_password_hash")
+        cleaned = {field_name: row[field_name] for field_name in self.required_fields}
+        cleaned["email"] = User.objects.normalize_email(cleaned["email"])
+        cleaned["otp_register_code"] = row.get("otp_register_code") or ""
+        return cleaned
+
+    def write(self, users: list[User], db: str) -> int:
+        if not users:
+            return 0
+        if connections[db].vendor != "postgresql":
+            before = User.objects.using(db).count()
+            User.objects.using(db).bulk_create(users, ignore_conflicts=True)
+            return User.objects.using(db).count() - before
+        return self.copy(users, connections[db])
+
+    def copy(self, users: list[User], connection) -> int:
+        # COPY로 임시 테이블에 적재한 뒤 email 중복은 건너뛰고 한 번에 반영
+        fields = [field for field in User._meta.concrete_fields if not field.primary_key]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        table = connection.ops.quote_name(User._meta.db_table)
+        email = connection.ops.quote_name(User._meta.get_field("email").column)
+        # 빈 값은 nullable 컬럼에서만 NULL, 나머지 컬럼에서는 빈 문자열
+        not_null = ", ".join(connection.ops.quote_name(field.column) for field in fields if not field.null)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for user in users:
+            writer.writerow([field.get_db_prep_save(field.pre_save(user, True), connection) for field in fields])
+        buffer.seek(0)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE import_users_stage ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            cursor.copy_expert(
+                f"COPY import_users_stage ({columns}) FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL ({not_null}))",
+                buffer
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM import_users_stage "
+                f"ON CONFLICT ({email}) DO NOTHING"
+            )
+            return cursor.rowcount
+
+    def read_checkpoint(self, checkpoint: str) -> int:
+        try:
+            with open(checkpoint) as f:
+                return json.load(f)["rows"]
+        except FileNotFoundError:
+            return 0
+
+    def write_checkpoint(self, checkpoint: str, rows: int) -> None:
+        with open(f"{checkpoint}.tmp", "w") as f:
+            json.dump({"rows": rows}, f)
+        os.replace(f"{checkpoint}.tmp", checkpoint)
@@ -0,0 +1,38 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from users.models import AuthOtp
+from project.conf import app_settings
+
+
+class Command(BaseCommand):
+    help = "Delete AuthOtp rows older than OTP_TIME_INTERVAL + AUTH_OTP_RETENTION in small batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--horizon", type=int, default=None, help="retention after expiry (second)")
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--sleep", type=float, default=0.0, help="pause between batches (second)")
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        horizon = app_settings.AUTH_OTP_RETENTION if options["horizon"] is None else options["horizon"]
+        before = timezone.now() - datetime.timedelta(seconds=app_settings.OTP_TIME_INTERVAL + horizon)
+        if options["dry_run"]:
+            count = AuthOtp.objects.filter(timestamp__lt=before).count()
+            self.stdout.write(f"{count} rows older than {before:%Y-%m-%d %H:%M:%S}")
+            return
+
+        total, started_at = 0, time.perf_counter()
+        batch_size = options["batch_size"] or app_settings.AUTH_OTP_PURGE_BATCH_SIZE
+        for deleted in AuthOtp.objects.purge_expired(before, batch_size):
+            total += deleted
+            self.stdout.write(f"deleted {total} rows")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        elapsed = time.perf_counter() - started_at
+        self.stdout.write(self.style.SUCCESS(
+            f"purged {total} rows older than {before:%Y-%m-%d %H:%M:%S} in {elapsed:.1f}s"
+        ))
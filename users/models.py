@@ -1,14 +1,42 @@
 import datetime
-import pyotp
-from typing import Any
-from django.db import models
+from typing import Any, Iterator
+from asgiref.sync import sync_to_async
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser, UserManager as BaseManager
 from django.core.exceptions import ValidationError
+from users import otp
 from users.choices import AuthOtpTypeEnum, LoginTypeEnum
+from users.hashers import password_hashing_executor, password_rehasher
 from project.conf import app_settings
 
 
 class UserManager(BaseManager):
+    login_lookups = {
+        LoginTypeEnum.EMAIL.value: "email",
+        LoginTypeEnum.PHONE_NUMBER.value: "phone_number",
+        LoginTypeEnum.USERNAME.value: "username",
+        LoginTypeEnum.NICKNAME.value: "nickname",
+    }
+    login_fields = [
+        "id",
+        "password",
+        "email",
+        "username",
+        "nickname",
+        "phone_number",
+        "is_staff",
+        "last_login_type",
+        "last_login_datetime"
+    ]
+
+    def get_by_login_type(self, login_type: str, value: str):
+        lookup = self.login_lookups[login_type]
+        return self.only(*self.login_fields).get(**{lookup: value})
+
+    async def aget_by_login_type(self, login_type: str, value: str):
+        lookup = self.login_lookups[login_type]
+        return await self.only(*self.login_fields).aget(**{lookup: value})
+
     def validate_request_kwargs(self, **kwargs) -> None:
         required_fields = [
             "email",
@@ -22,12 +50,15 @@ class UserManager(BaseManager):
             if not kwargs.get(field_name, None):
                 raise ValidationError(f"{field_name}_field_required")
 
-    def create_authenticated_user_from_request(self, **kwargs: Any):
+    def create_authenticated_user_from_request(self, auth_otp: "AuthOtp" = None, **kwargs: Any):
         self.validate_request_kwargs(**kwargs)
         kwargs["email"] = self.normalize_email(kwargs["email"])
         user: User = self.model(**kwargs)
+        # 이미 조회(잠금)한 인증정보: authenticate_user_phone에서 다시 조회하지 않음
+        user.verified_auth_otp = auth_otp
         user.set_password(kwargs["password"])
         user.save(using=self._db)
+        return user
 
     def create_superuser_from_server(self, email=None, password=None, **extra_fields):
         extra_fields.setdefault('is_staff', False)
@@ -37,6 +68,40 @@ class UserManager(BaseManager):
         user.save()
 
 
+class AuthOtpManager(models.Manager):
+    def latest_for(self, number: str, auth_type: str = None, authenticated: bool = None, for_update: bool = False):
+        queryset = self._filter_for(number, auth_type, authenticated)
+        if for_update:
+            queryset = queryset.select_for_update()
+        return queryset.latest()
+
+    async def alatest_for(self, number: str, auth_type: str = None, authenticated: bool = None):
+        return await self._filter_for(number, auth_type, authenticated).alatest()
+
+    def purge_expired(self, before: datetime.datetime, batch_size: int) -> Iterator[int]:
+        # 오래된 행부터 batch 단위로 짧은 transaction에서 삭제, 다른 요청이 잡고 있는 행은 건너뜀
+        while True:
+            with transaction.atomic(using=self.db):
+                pks = list(
+                    self.filter(timestamp__lt=before)
+                    .order_by("timestamp")
+                    .select_for_update(skip_locked=True)
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                if not pks:
+                    return
+                deleted, _ = self.filter(pk__in=pks).delete()
+            yield deleted
+
+    def _filter_for(self, number: str, auth_type: str = None, authenticated: bool = None):
+        filter_kwargs = {"number": number}
+        if auth_type is not None:
+            filter_kwargs["auth_type"] = auth_type
+        if authenticated is not None:
+            filter_kwargs["authenticated"] = authenticated
+        return self.filter(**filter_kwargs)
+
+
 class AbstractLoggingModel(models.Model):
     last_login_datetime = models.DateTimeField(
         blank=True,
@@ -78,9 +143,47 @@ class User(AbstractUser, AbstractLoggingModel):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username", "nickname", "phone_number"]
 
+    def set_password(self, raw_password):
+        self.password = password_hashing_executor.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        valid, must_update = password_hashing_executor.check_password(raw_password, self.password)
+        if valid and must_update:
+            password_rehasher.submit(self.pk, self.password, raw_password)
+        return valid
+
+    async def acheck_password(self, raw_password):
+        # 해시 검증만 event loop 밖에서 실행, 재해시 (DB 쓰기)는 thread_sensitive로 실행
+        valid, must_update = await sync_to_async(password_hashing_executor.check_password, thread_sensitive=False)(
+            raw_password, self.password
+        )
+        if valid and must_update:
+            await sync_to_async(password_rehasher.submit)(self.pk, self.password, raw_password)
+        return valid
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_phone_number = dict(zip(field_names, values)).get("phone_number")
+        return instance
+
+    @property
+    def phone_number_changed(self) -> bool:
+        if self._state.adding:
+            return True
+        if "phone_number" in self.get_deferred_fields():
+            return False
+        return self.phone_number != getattr(self, "_loaded_phone_number", None)
+
     class Meta:
         db_table = "User"
         verbose_name = "사용자"
+        indexes = [
+            models.Index(fields=["phone_number"], name="user_phone_number_idx"),
+            models.Index(fields=["username"], name="user_username_idx"),
+            models.Index(fields=["nickname"], name="user_nickname_idx"),
+        ]
 
 
 class AuthOtp(models.Model):
@@ -104,26 +207,35 @@ class AuthOtp(models.Model):
         verbose_name='휴대폰 인증 사용여부'
     )
 
+    objects = AuthOtpManager()
+
     class Meta:
         db_table = "AuthOtp"
         verbose_name = "인증"
         ordering = ['-timestamp']
         get_latest_by = ['timestamp']
+        # 쓰기가 많은 테이블이므로 실제 조회에 쓰이는 index만 유지
+        indexes = [
+            # purge_expired: WHERE timestamp < ? ORDER BY timestamp LIMIT ?
+            models.Index(fields=["timestamp"], name="authotp_ts_idx"),
+            # latest_for(number[, authenticated]): WHERE number = ? [AND authenticated = ?] ORDER BY timestamp DESC
+            # (번호별 행 수가 적어 authenticated는 index 없이 걸러도 충분)
+            models.Index(fields=["number", "-timestamp"], name="authotp_number_ts_idx"),
+            # latest_for(number, auth_type, authenticated) (issue / 비밀번호 재설정):
+            # WHERE number = ? AND auth_type = ? AND authenticated = ? ORDER BY timestamp DESC
+            models.Index(
+                fields=["number", "auth_type", "authenticated", "-timestamp"],
+                name="authotp_num_type_auth_ts_idx"
+            ),
+        ]
 
-    def authenticate_code_by_otp_key(self, code):
-        if self.otp_register_code:
-            return True
-        t = pyotp.TOTP(self.otp_key, interval=app_settings.OTP_TIME_INTERVAL)
-        valid = t.verify(str(code))
-        if valid:
-            self.otp_register_code = code
-        return valid
+    def otp_code_with_expiry(self) -> tuple[str, datetime.datetime]:
+        return otp.generate(self.otp_key, self.otp_interval)
 
     @property
     def otp_code(self) -> str:
-        t = pyotp.TOTP(self.otp_key, interval=app_settings.OTP_TIME_INTERVAL)
-        return str(t.at(datetime.datetime.now()))
+        return self.otp_code_with_expiry()[0]
 
     @property
     def otp_interval(self) -> int:
-        return pyotp.TOTP(self.otp_key, interval=app_settings.OTP_TIME_INTERVAL).interval
+        return app_settings.OTP_TIME_INTERVAL
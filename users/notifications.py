@@ -0,0 +1,140 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import NamedTuple
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from project.conf import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+class SMSMessage(NamedTuple):
+    number: str
+    body: str
+
+
+class BaseSMSProvider:
+    def send_messages(self, messages: list[SMSMessage]) -> int:
+        raise NotImplementedError("subclasses of BaseSMSProvider must provide a send_messages() method")
+
+
+class ConsoleSMSProvider(BaseSMSProvider):
+    def send_messages(self, messages: list[SMSMessage]) -> int:
+        for message in messages:
+            # 본문에 인증번호가 포함되므로 DEBUG로만 기록
+            logger.debug("sms %s: %s", message.number, message.body)
+        return len(messages)
+
+
+class LocMemSMSProvider(BaseSMSProvider):
+    # tests: 전송된 메시지는 outbox에, provider 호출 단위는 batches에 기록
+    outbox: list[SMSMessage] = []
+    batches: list[int] = []
+
+    def send_messages(self, messages: list[SMSMessage]) -> int:
+        LocMemSMSProvider.outbox.extend(messages)
+        LocMemSMSProvider.batches.append(len(messages))
+        return len(messages)
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.outbox.clear()
+        cls.batches.clear()
+
+
+class SMSDispatcher:
+    """
+    Hands OTP messages to SMS_WORKERS background threads so the request only pays for a queue put;
+    each worker drains up to SMS_BATCH_SIZE messages per provider call and retries failed batches.
+    """
+
+    def __init__(self):
+        self._queue = None
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def send(self, number: str, body: str) -> bool:
+        message = SMSMessage(number, body)
+        if not app_settings.SMS_WORKERS:
+            self._deliver([message])
+            return True
+
+        try:
+            self._get_queue().put_nowait(message)
+        except queue.Full:
+            logger.error("sms_queue_full number=%s", number)
+            return False
+        return True
+
+    def join(self) -> None:
+        if self._queue is not None:
+            self._queue.join()
+
+    def stop(self) -> None:
+        with self._lock:
+            messages, workers, self._queue, self._workers = self._queue, self._workers, None, []
+        if messages is None:
+            return
+        for _ in workers:
+            messages.put(None)
+        for worker in workers:
+            worker.join()
+
+    def _get_queue(self) -> queue.Queue:
+        with self._lock:
+            if self._queue is None:
+                self._queue = queue.Queue(maxsize=app_settings.SMS_QUEUE_SIZE)
+                self._workers = [
+                    threading.Thread(target=self._run, args=(self._queue,), name=f"sms-dispatcher-{i}", daemon=True)
+                    for i in range(app_settings.SMS_WORKERS)
+                ]
+                for worker in self._workers:
+                    worker.start()
+            return self._queue
+
+    def _run(self, messages: queue.Queue) -> None:
+        provider = app_settings.SMS_PROVIDER()
+        while True:
+            batch = [messages.get()]
+            while batch[-1] is not None and len(batch) < app_settings.SMS_BATCH_SIZE:
+                try:
+                    batch.append(messages.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopped = batch[-1] is None
+            try:
+                self._deliver([message for message in batch if message is not None], provider)
+            finally:
+                for _ in batch:
+                    messages.task_done()
+            if stopped:
+                return
+
+    def _deliver(self, batch: list[SMSMessage], provider: BaseSMSProvider = None) -> None:
+        if not batch:
+            return
+        provider = provider or app_settings.SMS_PROVIDER()
+        for attempt in range(app_settings.SMS_MAX_RETRIES + 1):
+            try:
+                provider.send_messages(batch)
+                return
+            except Exception:
+                if attempt == app_settings.SMS_MAX_RETRIES:
+                    logger.exception("sms_dispatch_failed size=%d", len(batch))
+                    return
+                time.sleep(app_settings.SMS_RETRY_BACKOFF * 2 ** attempt)
+
+
+sms_dispatcher = SMSDispatcher()
+atexit.register(sms_dispatcher.stop)
+
+
+@receiver(setting_changed)
+def reset_sms_dispatcher(setting, **kwargs):
+    if setting.startswith("SMS_"):
+        sms_dispatcher.stop()
@@ -0,0 +1,41 @@
+import datetime
+import functools
+from typing import Iterable
+
+import pyotp
+from pyotp.utils import strings_equal
+
+TOTP_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=TOTP_CACHE_SIZE)
+def get_totp(otp_key: str, interval: int) -> pyotp.TOTP:
+    return pyotp.TOTP(otp_key, interval=interval)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(tz=datetime.timezone.utc)
+
+
+def generate(otp_key: str, interval: int, for_time: datetime.datetime = None) -> tuple[str, datetime.datetime]:
+    totp = get_totp(otp_key, interval)
+    timecode = totp.timecode(for_time or _now())
+    expired_at = datetime.datetime.fromtimestamp((timecode + 1) * interval, tz=datetime.timezone.utc)
+    return totp.generate_otp(timecode), expired_at
+
+
+def verify(otp_key: str, interval: int, code, for_time: datetime.datetime = None) -> bool:
+    totp = get_totp(otp_key, interval)
+    return strings_equal(str(code), totp.generate_otp(totp.timecode(for_time or _now())))
+
+
+def verify_many(items: Iterable[tuple[str, str]], interval: int, for_time: datetime.datetime = None) -> list[bool]:
+    for_time = for_time or _now()
+    timecode = None
+    results = []
+    for otp_key, code in items:
+        totp = get_totp(otp_key, interval)
+        if timecode is None:
+            timecode = totp.timecode(for_time)
+        results.append(strings_equal(str(code), totp.generate_otp(timecode)))
+    return results
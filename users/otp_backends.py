@@ -0,0 +1,191 @@
+import pyotp
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils import timezone
+from users import otp
+from users.models import AuthOtp
+from project.conf import app_settings
+
+
+class BaseOtpBackend:
+    """
+    Storage for issued OTPs. Records are AuthOtp instances (unsaved for non-ORM backends),
+    latest() returns the newest record matching every given filter and a missing record
+    raises AuthOtp.DoesNotExist.
+    """
+
+    def latest(self, number: str, auth_type: str = None, authenticated: bool = None,
+               for_update: bool = False) -> AuthOtp:
+        raise NotImplementedError("subclasses of BaseOtpBackend must provide a latest() method")
+
+    def create(self, number: str, auth_type: str) -> AuthOtp:
+        raise NotImplementedError("subclasses of BaseOtpBackend must provide a create() method")
+
+    def register(self, auth_otp: AuthOtp, code: str) -> bool:
+        # 아직 등록된 코드가 없는 경우에만 등록, 동시 요청 중 한 요청만 True
+        raise NotImplementedError("subclasses of BaseOtpBackend must provide a register() method")
+
+    def mark_authenticated(self, auth_otp: AuthOtp) -> bool:
+        raise NotImplementedError("subclasses of BaseOtpBackend must provide a mark_authenticated() method")
+
+    def issue(self, number: str, auth_type: str) -> AuthOtp:
+        try:
+            return self.latest(number, auth_type=auth_type, authenticated=False)
+        except AuthOtp.DoesNotExist:
+            return self.create(number, auth_type)
+
+    def verify(self, auth_otp: AuthOtp, code: str) -> bool:
+        if auth_otp.otp_register_code:
+            return False
+        if not otp.verify(auth_otp.otp_key, auth_otp.otp_interval, code):
+            return False
+        registered = self.register(auth_otp, code)
+        if registered:
+            auth_otp.otp_register_code = code
+        return registered
+
+    async def alatest(self, number: str, auth_type: str = None, authenticated: bool = None) -> AuthOtp:
+        return await sync_to_async(self.latest, thread_sensitive=False)(number, auth_type, authenticated)
+
+    async def aissue(self, number: str, auth_type: str) -> AuthOtp:
+        return await sync_to_async(self.issue, thread_sensitive=False)(number, auth_type)
+
+    async def averify(self, auth_otp: AuthOtp, code: str) -> bool:
+        return await sync_to_async(self.verify, thread_sensitive=False)(auth_otp, code)
+
+
+class ModelOtpBackend(BaseOtpBackend):
+    def latest(self, number: str, auth_type: str = None, authenticated: bool = None,
+               for_update: bool = False) -> AuthOtp:
+        return AuthOtp.objects.latest_for(
+            number,
+            auth_type=auth_type,
+            authenticated=authenticated,
+            for_update=for_update
+        )
+
+    def create(self, number: str, auth_type: str) -> AuthOtp:
+        return AuthOtp.objects.create(number=number, auth_type=auth_type)
+
+    def register(self, auth_otp: AuthOtp, code: str) -> bool:
+        return bool(self._unregistered(auth_otp).update(otp_register_code=code))
+
+    def mark_authenticated(self, auth_otp: AuthOtp) -> bool:
+        updated = AuthOtp.objects.filter(pk=auth_otp.pk, authenticated=False).update(authenticated=True)
+        auth_otp.authenticated = True
+        return bool(updated)
+
+    async def alatest(self, number: str, auth_type: str = None, authenticated: bool = None) -> AuthOtp:
+        return await AuthOtp.objects.alatest_for(number, auth_type=auth_type, authenticated=authenticated)
+
+    async def aissue(self, number: str, auth_type: str) -> AuthOtp:
+        try:
+            return await self.alatest(number, auth_type=auth_type, authenticated=False)
+        except AuthOtp.DoesNotExist:
+            return await AuthOtp.objects.acreate(number=number, auth_type=auth_type)
+
+    async def averify(self, auth_otp: AuthOtp, code: str) -> bool:
+        if auth_otp.otp_register_code:
+            return False
+        if not otp.verify(auth_otp.otp_key, auth_otp.otp_interval, code):
+            return False
+        if not await self._unregistered(auth_otp).aupdate(otp_register_code=code):
+            return False
+        auth_otp.otp_register_code = code
+        return True
+
+    def _unregistered(self, auth_otp: AuthOtp):
+        # UPDATE ... WHERE id = ? AND otp_register_code IS NULL
+        return AuthOtp.objects.filter(pk=auth_otp.pk, otp_register_code__isnull=True)
+
+
+class CacheOtpBackend(BaseOtpBackend):
+    """
+    Keeps OTPs in OTP_CACHE for OTP_CACHE_TTL seconds. Registering a code and marking an OTP
+    authenticated are cache.add() calls, so only the first concurrent request wins.
+    The newest max_per_number OTPs of each number are indexed, newest first.
+    """
+    key_prefix = "otp"
+    max_per_number = 20
+
+    @property
+    def cache(self):
+        return caches[app_settings.OTP_CACHE]
+
+    def latest(self, number: str, auth_type: str = None, authenticated: bool = None,
+               for_update: bool = False) -> AuthOtp:
+        # for_update: 잠금 없음, register / mark_authenticated가 cache.add로 한 요청만 반영
+        # ModelOtpBackend와 동일하게 조건에 맞는 가장 최근 인증정보 (최신 인증정보만 확인하지 않음)
+        pks = self.cache.get(self._index_key(number), [])
+        values = self.cache.get_many([
+            self._key(pk, *suffix) for pk in pks for suffix in ((), ("register",), ("authenticated",))
+        ])
+        for pk in pks:
+            record = values.get(self._key(pk))
+            if record is None or (auth_type is not None and record["auth_type"] != auth_type):
+                continue
+            auth_otp = AuthOtp(
+                pk=pk,
+                otp_register_code=values.get(self._key(pk, "register")),
+                authenticated=self._key(pk, "authenticated") in values,
+                **record
+            )
+            if authenticated is None or auth_otp.authenticated == authenticated:
+                return auth_otp
+        raise AuthOtp.DoesNotExist("AuthOtp matching query does not exist.")
+
+    def create(self, number: str, auth_type: str) -> AuthOtp:
+        pk = self._next_pk()
+        record = {
+            "number": number,
+            "auth_type": auth_type,
+            "otp_key": pyotp.random_base32(),
+            "timestamp": timezone.now()
+        }
+        pks = [pk, *self.cache.get(self._index_key(number), [])][:self.max_per_number]
+        self.cache.set_many({
+            self._key(pk): record,
+            self._index_key(number): pks,
+        }, app_settings.OTP_CACHE_TTL)
+        return AuthOtp(pk=pk, **record)
+
+    def register(self, auth_otp: AuthOtp, code: str) -> bool:
+        key = self._key(auth_otp.pk, "register")
+        return self.cache.add(key, code, app_settings.OTP_CACHE_TTL)
+
+    def mark_authenticated(self, auth_otp: AuthOtp) -> bool:
+        updated = self.cache.add(self._key(auth_otp.pk, "authenticated"), True, app_settings.OTP_CACHE_TTL)
+        auth_otp.authenticated = True
+        return updated
+
+    def _next_pk(self) -> int:
+        key = self._key("seq")
+        self.cache.add(key, 0, None)
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            return self._next_pk()
+
+    def _key(self, *parts) -> str:
+        return ":".join([self.key_prefix, *map(str, parts)])
+
+    def _index_key(self, number: str) -> str:
+        return self._key("number", number)
+
+
+class InMemoryOtpBackend(CacheOtpBackend):
+    # tests: 프로세스 내부 전용 cache에 저장
+    _cache = LocMemCache("otp-backend-fake", {"OPTIONS": {"MAX_ENTRIES": 100000}})
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._cache.clear()
+
+
+def get_otp_backend() -> BaseOtpBackend:
+    return app_settings.OTP_BACKEND()
@@ -0,0 +1,101 @@
+import atexit
+import datetime
+import logging
+import threading
+
+from django.db import DatabaseError, close_old_connections
+from project.conf import app_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LastLoginRecorder:
+    SYNC = "sync"
+    BUFFERED = "buffered"
+
+    update_fields = ["last_login_datetime", "last_login_type"]
+
+    def __init__(self):
+        self._buffer: dict[int, tuple[datetime.datetime, str]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._worker = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def record(self, user, login_type: str, timestamp: datetime.datetime) -> None:
+        if app_settings.LAST_LOGIN_DURABILITY != self.BUFFERED:
+            user.last_login_datetime = timestamp
+            user.last_login_type = login_type
+            user.save(update_fields=self.update_fields)
+            return
+
+        with self._lock:
+            self._buffer[user.pk] = (timestamp, login_type)
+            pending = len(self._buffer)
+        self._ensure_worker()
+        if pending >= app_settings.LAST_LOGIN_BATCH_SIZE:
+            if self._worker is None:
+                # LAST_LOGIN_FLUSH_INTERVAL = 0: worker 없이 batch 크기마다 요청 thread에서 반영
+                self.flush()
+            else:
+                self._wakeup.set()
+
+    def flush(self) -> int:
+        with self._lock:
+            buffer, self._buffer = self._buffer, {}
+        if not buffer:
+            return 0
+
+        from users.models import User
+        users = [
+            User(pk=pk, last_login_datetime=timestamp, last_login_type=login_type)
+            for pk, (timestamp, login_type) in buffer.items()
+        ]
+        try:
+            User.objects.bulk_update(users, self.update_fields, batch_size=app_settings.LAST_LOGIN_BATCH_SIZE)
+        except DatabaseError:
+            with self._lock:
+                self._buffer = {**buffer, **self._buffer}
+            raise
+
+        # bulk_update는 post_save를 보내지 않음
+        from users.api.authentication import user_snapshot_cache
+        for pk in buffer:
+            user_snapshot_cache.invalidate(pk)
+        return len(users)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        self.flush()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None or not app_settings.LAST_LOGIN_FLUSH_INTERVAL:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._stopped.clear()
+                self._worker = threading.Thread(target=self._run, name="last-login-recorder", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(app_settings.LAST_LOGIN_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except DatabaseError:
+                logger.exception("last_login_flush_failed")
+        close_old_connections()
+
+
+last_login_recorder = LastLoginRecorder()
+atexit.register(last_login_recorder.stop)
@@ -1,4 +1,5 @@
-from rest_framework.exceptions import Throttled
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import Throttled, ValidationError
 from rest_framework.views import exception_handler
 
 
@@ -14,6 +15,9 @@ def get_error_details(data):
 
 
 def custom_exception_handler(exc, context):
+    # model / signal에서 발생한 Django ValidationError (예: authenticate_user_phone)도 400으로 응답
+    if isinstance(exc, DjangoValidationError):
+        exc = ValidationError(detail=exc.messages)
     response = exception_handler(exc, context)
     if isinstance(exc, Throttled):
         response.data = exc.detail
@@ -0,0 +1,212 @@
+import asyncio
+import bisect
+import contextvars
+import functools
+import threading
+import time
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from project.conf import app_settings
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+METRICS = {
+    "http_request_duration_seconds": ("Request latency per action", SECONDS_BUCKETS),
+    "db_queries_per_request": ("Database queries per request", COUNT_BUCKETS),
+    "db_query_duration_seconds": ("Time spent in SQL per request", SECONDS_BUCKETS),
+    "serializer_duration_seconds": ("Time spent in serializers per request, SQL excluded", SECONDS_BUCKETS),
+    "render_duration_seconds": ("Time spent rendering the response per request", SECONDS_BUCKETS),
+    "throttle_duration_seconds": ("Time spent in throttles per request", SECONDS_BUCKETS),
+}
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._histograms: dict[tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, action: str, value: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get((name, action))
+            if histogram is None:
+                histogram = self._histograms[(name, action)] = Histogram(METRICS[name][1])
+            histogram.observe(value)
+
+    def get(self, name: str, action: str) -> Histogram:
+        return self._histograms.get((name, action))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def render(self) -> str:
+        lines = []
+        with self._lock:
+            for name, (description, _) in METRICS.items():
+                lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+                for (metric, action), histogram in sorted(self._histograms.items()):
+                    if metric != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{action="{action}",le="{bound}"}} {cumulative}')
+                    lines.append(f'{name}_sum{{action="{action}"}} {histogram.sum}')
+                    lines.append(f'{name}_count{{action="{action}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+class RequestMetrics:
+    __slots__ = ("queries", "sql", "serializer", "render", "throttle")
+
+    def __init__(self):
+        self.queries = 0
+        self.sql = self.serializer = self.render = self.throttle = 0.0
+
+    def observe(self, action: str, duration: float) -> None:
+        registry.observe("http_request_duration_seconds", action, duration)
+        registry.observe("db_queries_per_request", action, self.queries)
+        registry.observe("db_query_duration_seconds", action, self.sql)
+        registry.observe("serializer_duration_seconds", action, self.serializer)
+        registry.observe("render_duration_seconds", action, self.render)
+        registry.observe("throttle_duration_seconds", action, self.throttle)
+
+
+current_metrics: contextvars.ContextVar[RequestMetrics] = contextvars.ContextVar("current_metrics", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.sql += time.perf_counter() - started_at
+        metrics.queries += 1
+
+
+def install_query_recorder(connection) -> None:
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@receiver(connection_created)
+def install_query_recorder_on_connect(sender, connection, **kwargs):
+    # sync_to_async thread 등 middleware가 실행되지 않은 thread의 연결에도 기록
+    install_query_recorder(connection)
+
+
+def timed(field: str, exclude_sql: bool = False):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = current_metrics.get()
+            if metrics is None:
+                return func(*args, **kwargs)
+            started_at, sql = time.perf_counter(), metrics.sql
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started_at
+                if exclude_sql:
+                    elapsed -= metrics.sql - sql
+                setattr(metrics, field, getattr(metrics, field) + elapsed)
+
+        return wrapper
+
+    return decorator
+
+
+class MetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = asyncio.iscoroutinefunction(get_response)
+        if self.is_async:
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not app_settings.METRICS_ENABLED:
+            return self.get_response(request)
+
+        for connection in connections.all():
+            install_query_recorder(connection)
+        token, started_at = current_metrics.set(RequestMetrics()), time.perf_counter()
+        try:
+            response = self.get_response(request)
+            self.observe(request, started_at)
+        finally:
+            current_metrics.reset(token)
+        return response
+
+    async def __acall__(self, request):
+        if not app_settings.METRICS_ENABLED:
+            return await self.get_response(request)
+
+        token, started_at = current_metrics.set(RequestMetrics()), time.perf_counter()
+        try:
+            response = await self.get_response(request)
+            self.observe(request, started_at)
+        finally:
+            current_metrics.reset(token)
+        return response
+
+    def observe(self, request, started_at: float) -> None:
+        match = request.resolver_match
+        action = match.view_name if match is not None else "unmatched"
+        current_metrics.get().observe(action, time.perf_counter() - started_at)
+
+
+_timed_serializer_classes = {}
+
+
+class MetricsViewMixin:
+    def check_throttles(self, request):
+        return timed("throttle")(super().check_throttles)(request)
+
+    def get_serializer_class(self):
+        serializer_class = super().get_serializer_class()
+        try:
+            return _timed_serializer_classes[serializer_class]
+        except KeyError:
+            timed_class = type(serializer_class.__name__, (serializer_class,), {
+                "__module__": serializer_class.__module__,
+                "is_valid": timed("serializer", exclude_sql=True)(serializer_class.is_valid),
+                "save": timed("serializer", exclude_sql=True)(serializer_class.save),
+                "data": property(timed("serializer", exclude_sql=True)(serializer_class.data.fget)),
+            })
+            return _timed_serializer_classes.setdefault(serializer_class, timed_class)
+
+
+def metrics_view(request):
+    if not app_settings.METRICS_ENABLED:
+        raise Http404
+    if request.META.get("REMOTE_ADDR") not in app_settings.METRICS_ALLOWED_IPS:
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
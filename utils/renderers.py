@@ -1,6 +1,17 @@
 import json
+import uuid
+import decimal
+import datetime
+from django.utils.functional import Promise
 from rest_framework import renderers
 from rest_framework.status import is_success, is_client_error, is_server_error
+from project.conf import app_settings
+from utils.metrics import timed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def set_response_key(code: int) -> tuple[str, str]:
@@ -14,10 +25,42 @@ def set_response_key(code: int) -> tuple[str, str]:
     return status, data
 
 
+def json_default(obj):
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    elif isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    elif isinstance(obj, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(obj)
+    elif isinstance(obj, bytes):
+        return obj.decode()
+    elif hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError(f"{type(obj).__name__}_is_not_json_serializable")
+
+
+def json_dumps(data) -> bytes:
+    return json.dumps(data, default=json_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def orjson_dumps(data) -> bytes:
+    return orjson.dumps(data, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_json_backend(name: str):
+    if name == 'auto':
+        name = 'orjson' if orjson is not None else 'json'
+    if name == 'orjson' and orjson is None:
+        raise ImportError("orjson_is_not_installed")
+    return {'json': json_dumps, 'orjson': orjson_dumps}[name]
+
+
 class ResponseRenderer(renderers.JSONRenderer):
     charset = 'utf-8'
 
+    @timed("render")
     def render(self, data, accepted_media_type=None, renderer_context=None):
         response = renderer_context.get('response')
         status, data_key = set_response_key(response.status_code)
-        return json.dumps({"status": status, data_key: data})
+        dumps = get_json_backend(app_settings.RESPONSE_JSON_BACKEND)
+        return dumps({"status": status, data_key: data})
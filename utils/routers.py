@@ -0,0 +1,34 @@
+import contextlib
+import contextvars
+import random
+
+from project.conf import app_settings
+
+_read_replica = contextvars.ContextVar("read_replica", default=False)
+
+
+@contextlib.contextmanager
+def read_replica():
+    # 복제 지연을 허용하는 조회만 replica 사용 (인증정보처럼 쓰기 직후 읽는 조회는 primary)
+    token = _read_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_replica.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = app_settings.DATABASE_REPLICAS
+        if replicas and _read_replica.get():
+            return random.choice(replicas)
+        return None
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in app_settings.DATABASE_REPLICAS
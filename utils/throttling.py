@@ -0,0 +1,150 @@
+import math
+import threading
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from rest_framework import throttling
+from project.conf import app_settings
+
+
+class SharedCacheThrottle(throttling.SimpleRateThrottle):
+    @property
+    def cache(self):
+        return caches[app_settings.THROTTLE_CACHE]
+
+    async def aallow_request(self, request, view):
+        # 캐시 연산을 한 번의 thread 전환으로 처리 (DB 연결이 필요 없으므로 thread_sensitive=False)
+        return await sync_to_async(self.allow_request, thread_sensitive=False)(request, view)
+
+    def throttle_success(self):
+        return True
+
+
+class SharedRateThrottle(SharedCacheThrottle):
+    """
+    Sliding window counter stored in the shared THROTTLE_CACHE with atomic add/incr,
+    so the rate applies across every worker process.
+    """
+    cache_format = 'throttle_%(scope)s_%(ident)s'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.elapsed = self.now - window * self.duration
+        current_key, previous_key = f"{self.key}:{window}", f"{self.key}:{window - 1}"
+
+        self.current = self._incr(current_key)
+        self.previous = self.cache.get(previous_key, 0)
+        if self._estimate(self.current) > self.num_requests:
+            self.current = self.cache.decr(current_key)
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def _estimate(self, current: int) -> float:
+        return self.previous * (1 - self.elapsed / self.duration) + current
+
+    def _incr(self, key: str) -> int:
+        if self.cache.add(key, 1, self.duration * 2):
+            return 1
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            return self._incr(key)
+
+    def wait(self):
+        allowed = self.num_requests - 1
+        if self.current > allowed:
+            remaining = self.duration - self.elapsed
+            return remaining + max(0.0, self.duration * (1 - allowed / self.current))
+        if not self.previous:
+            return None
+        return max(0.0, self.duration * (1 - (allowed - self.current) / self.previous) - self.elapsed)
+
+
+class GCRARateThrottle(SharedCacheThrottle):
+    """
+    Generic cell rate algorithm (token bucket): a single theoretical arrival time per key,
+    so the cost of a request does not depend on the size of the rate.
+    """
+    cache_format = 'throttle_gcra_%(scope)s_%(ident)s'
+    precision = 1e-6
+    lock = threading.Lock()
+    script = """
+        local now = tonumber(ARGV[1])
+        local emission = tonumber(ARGV[2])
+        local tolerance = tonumber(ARGV[3])
+        local tat = math.max(tonumber(redis.call('GET', KEYS[1]) or now), now)
+        local retry_after = tat + emission - tolerance - now
+        if retry_after > 0 then
+            return {0, tostring(retry_after)}
+        end
+        redis.call('SET', KEYS[1], tostring(tat + emission), 'PX', math.ceil((tat + emission - now) * 1000))
+        return {1, '0'}
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        emission = self.duration / self.num_requests
+        self.tolerance = self.duration + self.precision
+        if isinstance(self.cache, RedisCache):
+            allowed, self.retry_after = self._update_redis(emission)
+        else:
+            allowed, self.retry_after = self._update_local(emission)
+        return self.throttle_success() if allowed else self.throttle_failure()
+
+    def _update_local(self, emission: float) -> tuple[bool, float]:
+        with self.lock:
+            tat = max(self.cache.get(self.key, self.now), self.now)
+            retry_after = tat + emission - self.tolerance - self.now
+            if retry_after > 0:
+                return False, retry_after
+            self.cache.set(self.key, tat + emission, math.ceil(tat + emission - self.now))
+            return True, 0.0
+
+    def _update_redis(self, emission: float) -> tuple[bool, float]:
+        client = self.cache._cache.get_client(self.key, write=True)
+        key = self.cache.make_and_validate_key(self.key)
+        allowed, retry_after = client.eval(self.script, 1, key, self.now, emission, self.tolerance)
+        return bool(allowed), float(retry_after)
+
+    def wait(self):
+        return self.retry_after
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, SharedRateThrottle):
+    pass
+
+
+class UserRateThrottle(throttling.UserRateThrottle, SharedRateThrottle):
+    pass
+
+
+class ScopedRateThrottle(throttling.ScopedRateThrottle, SharedRateThrottle):
+    pass
+
+
+class AnonGCRAThrottle(throttling.AnonRateThrottle, GCRARateThrottle):
+    pass
+
+
+class UserGCRAThrottle(throttling.UserRateThrottle, GCRARateThrottle):
+    pass
+
+
+class ScopedGCRAThrottle(throttling.ScopedRateThrottle, GCRARateThrottle):
+    pass